@@ -44,7 +44,8 @@ from google.genai.types import Content, Part
 from teams.lead_discovery import lead_discovery_team
 from teams.outreach_strategy import outreach_strategy_team
 from teams.response_handling import response_handling_team
-from teams.meeting_booking import meeting_booking_team
+from teams.meeting_booking import build_meeting_booking_team
+from teams._output import write_json
 
 import db.repositories.organizations as org_repo
 import db.repositories.contacts as contact_repo
@@ -70,10 +71,13 @@ async def run_agent(team, session_id: str, message: str) -> dict:
     """Run a team and return the final session state."""
     session_service = InMemorySessionService()
     app_name = f"backflip_{team.name.lower()}"
+    # Seed session state with the JSON payload so the {placeholders} in agent
+    # instructions (and custom agents reading ctx.session.state) resolve.
     await session_service.create_session(
         app_name=app_name,
         user_id="backflip_pipeline",
         session_id=session_id,
+        state=json.loads(message),
     )
     runner = Runner(
         agent=team,
@@ -194,7 +198,7 @@ async def run_discovery(lead_limit: int = 10) -> dict:
 
     campaign = outreach_state.get("campaign_json", {})
     campaign_path = OUTPUT_DIR / "campaign.json"
-    campaign_path.write_text(json.dumps(campaign, indent=2))
+    write_json(campaign_path, campaign)
     print(f"  Campaign written to {campaign_path}")
     print(f"  Sequences built: {campaign.get('lead_count', 0)}")
 
@@ -286,7 +290,7 @@ async def run_discovery(lead_limit: int = 10) -> dict:
         try:
             import re
             from tools.hunter_tools import (
-                hunter_create_lead, hunter_add_recipient,
+                hunter_create_leads_batch, hunter_add_recipient,
                 hunter_list_campaigns, hunter_start_campaign,
             )
 
@@ -309,30 +313,31 @@ async def run_discovery(lead_limit: int = 10) -> dict:
                 print("  SKIPPED — campaign is already started (pause it first)")
             else:
                 _email_re = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-                recipient_emails = []
-                recipient_lead_ids = []
+                new_leads = []
                 for seq in sequences:
                     contacts = seq.get("contacts", [])
-                    lead_name = seq.get("lead_name", "")
                     if contacts:
                         email = contacts[0]
                         # L2 fix: basic email format validation
                         if not _email_re.match(email):
                             logger.warning("Skipping invalid email: %r", email)
                             continue
-                        # C2 fix: check create_lead result before adding to recipients
-                        lead_result = hunter_create_lead(
-                            email=email,
-                            company=lead_name,
+                        new_leads.append({"email": email, "company": seq.get("lead_name", "")})
+
+                # Create all leads concurrently (bounded by the Hunter client's semaphore)
+                lead_results = (await hunter_create_leads_batch(new_leads))["results"]
+                recipient_emails = []
+                recipient_lead_ids = []
+                for lead_result in lead_results:
+                    # C2 fix: check create_lead result before adding to recipients
+                    if lead_result.get("lead_id") is not None:
+                        recipient_emails.append(lead_result["email"])
+                        recipient_lead_ids.append(lead_result["lead_id"])
+                    else:
+                        logger.warning(
+                            "Skipping recipient %s — lead creation failed: %s",
+                            lead_result["email"], lead_result.get("error", "unknown"),
                         )
-                        if lead_result.get("lead_id") is not None:
-                            recipient_emails.append(email)
-                            recipient_lead_ids.append(lead_result["lead_id"])
-                        else:
-                            logger.warning(
-                                "Skipping recipient %s — lead creation failed: %s",
-                                email, lead_result.get("error", "unknown"),
-                            )
 
                 if recipient_emails:
                     result = hunter_add_recipient(
@@ -457,7 +462,7 @@ async def run_reply_handler(lead_id: str, reply_text: str, contact_email: str =
         logger.warning("DB write failed after Stage 3 (pipeline continues): %s", e, exc_info=True)
 
     result_path = OUTPUT_DIR / f"reply_{lead_id}.json"
-    result_path.write_text(json.dumps(state, indent=2))
+    write_json(result_path, state)
     print(f"  Result saved to {result_path}")
     return state
 
@@ -491,7 +496,7 @@ async def run_meeting_booking(
         payload["confirmed_slot"] = confirmed_slot
 
     state = await run_agent(
-        meeting_booking_team,
+        build_meeting_booking_team(),
         session_id=f"booking_{lead_id}",
         message=json.dumps(payload),
     )
@@ -561,7 +566,7 @@ async def run_meeting_booking(
         logger.warning("DB write failed after Stage 4 (pipeline continues): %s", e, exc_info=True)
 
     result_path = OUTPUT_DIR / f"booking_{lead_id}.json"
-    result_path.write_text(json.dumps(state, indent=2))
+    write_json(result_path, state)
     print(f"  Result saved to {result_path}")
     return state
 
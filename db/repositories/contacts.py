@@ -54,3 +54,19 @@ async def is_suppressed(session: AsyncSession, email: str) -> bool:
         select(SuppressionList.id).where(SuppressionList.email == email)
     )
     return result.scalar_one_or_none() is not None
+
+
+async def load_suppressed_set(session: AsyncSession, emails: list[str]) -> set[str]:
+    """Return which of these emails are suppressed, in one query.
+
+    Use before sending a batch instead of calling is_suppressed per address.
+    Emails are normalised (lowercased, stripped); check membership with the
+    normalised form.
+    """
+    normalised = {e.lower().strip() for e in emails}
+    if not normalised:
+        return set()
+    result = await session.execute(
+        select(SuppressionList.email).where(SuppressionList.email.in_(normalised))
+    )
+    return set(result.scalars().all())
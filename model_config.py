@@ -4,9 +4,14 @@ Priority:
   1. ANTHROPIC_API_KEY set → use Anthropic API directly (faster, simpler)
   2. Otherwise → use Vertex AI (requires GOOGLE_CLOUD_PROJECT + service account)
 
+Two tiers:
+  - get_reasoning_model(): Sonnet, for ICP synthesis, research, copywriting and
+    anything that writes to a prospect.
+  - get_utility_model(): Haiku, for routine classification and JSON assembly.
+
 Usage:
-    from model_config import get_llm_model
-    model = get_llm_model()
+    from model_config import get_reasoning_model, get_utility_model
+    model = get_reasoning_model()
 """
 import os
 from google.adk.models.lite_llm import LiteLlm
@@ -14,16 +19,57 @@ from google.adk.models.lite_llm import LiteLlm
 # Model identifiers
 ANTHROPIC_MODEL = "anthropic/claude-sonnet-4-6"
 VERTEX_MODEL = "vertex_ai/claude-sonnet-4-5@20250929"
+ANTHROPIC_UTILITY_MODEL = "anthropic/claude-haiku-4-5"
+VERTEX_UTILITY_MODEL = "vertex_ai/claude-haiku-4-5@20251001"
+
+
+# Anthropic prompt caching: mark the system message (the agent's
+# static_instruction) as a cacheable prefix. Static persona/ICP/template text
+# changes at most per deploy, so it gets the 1-hour tier.
+_SYSTEM_PROMPT_CACHE_POINTS = [
+    {
+        "location": "message",
+        "role": "system",
+        "control": {"type": "ephemeral", "ttl": "1h"},
+    },
+]
+
 
+def _build(anthropic_model: str, vertex_model: str, cache_system_prompt: bool) -> LiteLlm:
+    model = anthropic_model if active_provider() == "anthropic" else vertex_model
+    if cache_system_prompt:
+        return LiteLlm(model, cache_control_injection_points=_SYSTEM_PROMPT_CACHE_POINTS)
+    return LiteLlm(model)
 
-def get_llm_model() -> LiteLlm:
-    """Return a LiteLlm instance for the active provider.
+
+def get_reasoning_model(cache_system_prompt: bool = False) -> LiteLlm:
+    """Return the strong (Sonnet) model for the active provider.
 
     Selects Anthropic API if ANTHROPIC_API_KEY is set, otherwise Vertex AI.
+
+    Args:
+        cache_system_prompt: Inject an Anthropic ``cache_control`` marker on the
+            system message. Only useful for agents that put their large, static
+            text in ``static_instruction`` and keep per-call data in
+            ``instruction`` (which ADK then sends as user content).
     """
-    if os.environ.get("ANTHROPIC_API_KEY"):
-        return LiteLlm(ANTHROPIC_MODEL)
-    return LiteLlm(VERTEX_MODEL)
+    return _build(ANTHROPIC_MODEL, VERTEX_MODEL, cache_system_prompt)
+
+
+def get_utility_model(cache_system_prompt: bool = False) -> LiteLlm:
+    """Return the cheap (Haiku) model for the active provider.
+
+    For sub-agents whose task is routine — picking one of a few labels, or
+    reformatting JSON another agent already wrote.
+
+    Args:
+        cache_system_prompt: See ``get_reasoning_model``.
+    """
+    return _build(ANTHROPIC_UTILITY_MODEL, VERTEX_UTILITY_MODEL, cache_system_prompt)
+
+
+# Older call sites; same as get_reasoning_model.
+get_llm_model = get_reasoning_model
 
 
 def active_provider() -> str:
@@ -5,9 +5,9 @@ from pydantic import BaseModel, Field
 
 class EmailTouch(BaseModel):
     touch_number: int = Field(ge=1, le=3)
-    send_day: int
-    subject: str
-    body: str
+    send_day: int = Field(ge=1)
+    subject: str = Field(min_length=1, max_length=80)
+    body: str = Field(min_length=1)
 
 
 class EmailSequence(BaseModel):
@@ -27,6 +27,9 @@ class CampaignOutput(BaseModel):
     campaign_path: str
     lead_count: int
     sequences: List[EmailSequence]
+    # One {"lead_id", "errors"} entry per sequence that failed validation
+    # and was left out of ``sequences``.
+    validation_errors: List[dict] = Field(default_factory=list)
 
 
 ReplyClassification = Literal["INTERESTED", "NURTURE", "NOT_FIT", "UNSUBSCRIBE"]
@@ -8,27 +8,28 @@ Reads from PostgreSQL via existing SQLAlchemy repos and writes Markdown
 files that `ctx sync` will ingest into the FTS5 SQLite store.
 
 CTX_SYNC_DIR controls the output directory (default: ./context_harness_sync).
+CTX_SYNC_FSYNC=1 fsyncs each file before its atomic rename (default: off).
 """
 import asyncio
 import logging
 import os
 import sys
 from pathlib import Path
+from typing import Sequence
 
 # Resolve project root so imports work when run from any cwd
 _ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_ROOT))
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from db.connection import get_db
 from db.models import (
     EmailSequence,
-    EmailTouch,
     Organization,
     OutcomeFeedback,
 )
-import db.repositories.pipeline as pipeline_repo
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -41,106 +42,122 @@ def _safe_name(s: str) -> str:
     return "".join(c if c.isalnum() or c in "-_." else "_" for c in s).strip("_.")
 
 
-async def _sync_sequences(sync_dir: Path) -> int:
-    """Write one Markdown file per org containing all email touches."""
-    seq_dir = sync_dir / "sequences"
-    seq_dir.mkdir(parents=True, exist_ok=True)
+def _atomic_write(path: Path, data: str) -> None:
+    """Write data to path via a temp file + os.replace.
+
+    Readers (e.g. a concurrent `ctx sync`) see either the old file or the
+    new one, never a partial write. Set CTX_SYNC_FSYNC=1 to fsync before
+    the rename for durability across crashes.
+    """
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(data)
+            if os.environ.get("CTX_SYNC_FSYNC") == "1":
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _sequence_lines(org: Organization) -> list[str]:
+    """Render all email touches for an org (sequences prefetched)."""
+    lines = [
+        f"# Email Sequence: {org.name} ({org.domain})",
+        f"ICP Score: {org.icp_score or 'N/A'} | Stage: {org.pipeline_stage}",
+        "",
+    ]
 
-    written = 0
-    async with get_db() as session:
-        # Load all orgs that have at least one sequence
-        org_ids_result = await session.execute(
-            select(EmailSequence.org_id).where(EmailSequence.org_id.isnot(None)).distinct()
-        )
-        org_ids = [row[0] for row in org_ids_result.all()]
+    for seq in sorted(org.email_sequences, key=lambda seq: seq.created_at):
+        if seq.personalization_hook:
+            lines.append(f"Personalization Hook: {seq.personalization_hook}")
+            lines.append("")
 
-        orgs_result = await session.execute(
-            select(Organization).where(Organization.id.in_(org_ids))
-        )
-        orgs = list(orgs_result.scalars().all())
+        for touch in sorted(seq.email_touches, key=lambda touch: touch.touch_number):
+            subject = touch.subject or "(no subject)"
+            body = touch.body or "(no body)"
+            lines.append(f"## Touch {touch.touch_number} — Subject: {subject}")
+            lines.append(body)
+            lines.append("")
 
-        for org in orgs:
-            seq_result = await session.execute(
-                select(EmailSequence)
-                .where(EmailSequence.org_id == org.id)
-                .order_by(EmailSequence.created_at)
-            )
-            sequences = list(seq_result.scalars().all())
-
-            lines = [
-                f"# Email Sequence: {org.name} ({org.domain})",
-                f"ICP Score: {org.icp_score or 'N/A'} | Stage: {org.pipeline_stage}",
-                "",
-            ]
-
-            for seq in sequences:
-                if seq.personalization_hook:
-                    lines.append(f"Personalization Hook: {seq.personalization_hook}")
-                    lines.append("")
-
-                touch_result = await session.execute(
-                    select(EmailTouch)
-                    .where(EmailTouch.sequence_id == seq.id)
-                    .order_by(EmailTouch.touch_number)
-                )
-                touches = list(touch_result.scalars().all())
-
-                for touch in touches:
-                    subject = touch.subject or "(no subject)"
-                    body = touch.body or "(no body)"
-                    lines.append(f"## Touch {touch.touch_number} — Subject: {subject}")
-                    lines.append(body)
-                    lines.append("")
-
-            filename = seq_dir / f"{_safe_name(org.domain)}.md"
-            filename.write_text("\n".join(lines), encoding="utf-8")
-            written += 1
+    return lines
 
-    return written
 
+def _reply_lines(org: Organization) -> list[str]:
+    """Render all classified replies for an org (replies prefetched)."""
+    lines = [
+        f"# Reply History: {org.name} ({org.domain})",
+        f"Stage: {org.pipeline_stage}",
+        "",
+    ]
 
-async def _sync_replies(sync_dir: Path) -> int:
-    """Write one Markdown file per org containing all classified replies."""
-    replies_dir = sync_dir / "replies"
-    replies_dir.mkdir(parents=True, exist_ok=True)
+    for reply in sorted(org.inbound_replies, key=lambda reply: reply.received_at):
+        classification = reply.classification or "UNKNOWN"
+        received = reply.received_at.isoformat() if reply.received_at else ""
 
-    written = 0
+        lines.append(f"## Reply [{classification}] — {received}")
+        lines.append(f"Text: {reply.reply_text or ''}")
+        if reply.key_phrase:
+            lines.append(f"Key Phrase: {reply.key_phrase}")
+        if reply.classification_reasoning:
+            lines.append(f"Reasoning: {reply.classification_reasoning}")
+        lines.append("")
+
+    return lines
+
+
+def _emit_all_for_org(org: Organization, sync_dir: Path) -> tuple[int, int]:
+    """Write the sequences/ and replies/ Markdown files for one org.
+
+    Returns (sequence_files_written, reply_files_written).
+    """
+    filename = f"{_safe_name(org.domain)}.md"
+
+    seq_written = 0
+    if org.email_sequences:
+        _atomic_write(sync_dir / "sequences" / filename, "\n".join(_sequence_lines(org)))
+        seq_written = 1
+
+    if not org.inbound_replies:
+        return seq_written, 0
+
+    _atomic_write(sync_dir / "replies" / filename, "\n".join(_reply_lines(org)))
+    return seq_written, 1
+
+
+async def _load_orgs() -> Sequence[Organization]:
+    """Load every org with its sequences, touches and replies prefetched.
+
+    Loaded once in main() and shared by the per-org and ICP snapshot phases,
+    so email_sequences (and its icp_profile_snapshot JSON) is scanned and
+    decoded a single time. Each selectinload is one IN-list query, so this
+    costs four round trips regardless of org count.
+    """
     async with get_db() as session:
-        orgs_result = await session.execute(select(Organization))
-        orgs = list(orgs_result.scalars().all())
-
-        for org in orgs:
-            history = await pipeline_repo.get_org_history(session, org.id)
-            replies = history.get("replies", [])
-            if not replies:
-                continue
-
-            lines = [
-                f"# Reply History: {org.name} ({org.domain})",
-                f"Stage: {org.pipeline_stage}",
-                "",
-            ]
-
-            for reply in replies:
-                classification = reply.get("classification", "UNKNOWN")
-                text = reply.get("reply_text", "")
-                key_phrase = reply.get("key_phrase", "")
-                reasoning = reply.get("classification_reasoning", "")
-                received = reply.get("received_at", "")
-
-                lines.append(f"## Reply [{classification}] — {received}")
-                lines.append(f"Text: {text}")
-                if key_phrase:
-                    lines.append(f"Key Phrase: {key_phrase}")
-                if reasoning:
-                    lines.append(f"Reasoning: {reasoning}")
-                lines.append("")
+        result = await session.execute(
+            select(Organization).options(
+                selectinload(Organization.email_sequences)
+                .selectinload(EmailSequence.email_touches),
+                selectinload(Organization.inbound_replies),
+            )
+        )
+        return result.scalars().all()
 
-            filename = replies_dir / f"{_safe_name(org.domain)}.md"
-            filename.write_text("\n".join(lines), encoding="utf-8")
-            written += 1
 
-    return written
+def _sync_orgs(sync_dir: Path, orgs: Sequence[Organization]) -> tuple[int, int]:
+    """Write per-org sequences/ and replies/ files in a single pass over orgs."""
+    (sync_dir / "sequences").mkdir(parents=True, exist_ok=True)
+    (sync_dir / "replies").mkdir(parents=True, exist_ok=True)
+
+    seq_count = replies_count = 0
+    for org in orgs:
+        seq_written, replies_written = _emit_all_for_org(org, sync_dir)
+        seq_count += seq_written
+        replies_count += replies_written
+
+    return seq_count, replies_count
 
 
 async def _sync_outcomes(sync_dir: Path) -> int:
@@ -185,30 +202,27 @@ async def _sync_outcomes(sync_dir: Path) -> int:
         lines.append("")
 
     feedback_path = outcomes_dir / "feedback.md"
-    feedback_path.write_text("\n".join(lines), encoding="utf-8")
+    _atomic_write(feedback_path, "\n".join(lines))
     return 1
 
 
-async def _sync_icp_snapshots(sync_dir: Path) -> int:
+def _sync_icp_snapshots(sync_dir: Path, orgs: Sequence[Organization]) -> int:
     """Write one ICP snapshot Markdown file per org (first sequence with a snapshot)."""
     icp_dir = sync_dir / "icp_snapshots"
     icp_dir.mkdir(parents=True, exist_ok=True)
 
     written = 0
-    async with get_db() as session:
-        result = await session.execute(
-            select(EmailSequence, Organization)
-            .join(Organization, EmailSequence.org_id == Organization.id)
-            .where(EmailSequence.icp_profile_snapshot.isnot(None))
-            .order_by(Organization.id, EmailSequence.created_at)
+    for org in orgs:
+        seq = next(
+            (
+                seq
+                for seq in sorted(org.email_sequences, key=lambda seq: seq.created_at)
+                if seq.icp_profile_snapshot is not None
+            ),
+            None,
         )
-        rows = result.all()
-
-    seen_org_ids: set = set()
-    for seq, org in rows:
-        if org.id in seen_org_ids:
+        if seq is None:
             continue
-        seen_org_ids.add(org.id)
 
         snapshot = seq.icp_profile_snapshot or {}
         lines = [
@@ -237,7 +251,7 @@ async def _sync_icp_snapshots(sync_dir: Path) -> int:
             lines.append(f"## Summary\n{summary}\n")
 
         filename = icp_dir / f"{_safe_name(org.domain)}.md"
-        filename.write_text("\n".join(lines), encoding="utf-8")
+        _atomic_write(filename, "\n".join(lines))
         written += 1
 
     return written
@@ -247,16 +261,16 @@ async def main() -> None:
     SYNC_DIR.mkdir(parents=True, exist_ok=True)
     logger.info("Syncing to %s ...", SYNC_DIR.resolve())
 
-    seq_count = await _sync_sequences(SYNC_DIR)
-    logger.info("  sequences/: %d files written", seq_count)
+    orgs = await _load_orgs()
 
-    replies_count = await _sync_replies(SYNC_DIR)
+    seq_count, replies_count = _sync_orgs(SYNC_DIR, orgs)
+    logger.info("  sequences/: %d files written", seq_count)
     logger.info("  replies/: %d files written", replies_count)
 
     outcomes_count = await _sync_outcomes(SYNC_DIR)
     logger.info("  outcomes/: %d files written", outcomes_count)
 
-    icp_count = await _sync_icp_snapshots(SYNC_DIR)
+    icp_count = _sync_icp_snapshots(SYNC_DIR, orgs)
     logger.info("  icp_snapshots/: %d files written", icp_count)
 
     total = seq_count + replies_count + outcomes_count + icp_count
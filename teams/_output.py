@@ -0,0 +1,34 @@
+"""Helpers for reading agents' output_key values back out of session state and
+writing the pipeline's JSON output files."""
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pydantic_core
+
+
+def parse_json_output(raw: Any) -> Any:
+    """Parse an agent's output_key value, tolerating ```json fences."""
+    if not isinstance(raw, str):
+        return raw
+    text = raw.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    return json.loads(text)
+
+
+def write_json(path: Path, value: Any) -> None:
+    """Write value to path as indented JSON, atomically (temp file + rename).
+
+    Serialized with pydantic-core's Rust encoder, which is several times
+    faster than stdlib json on a large campaign. Readers never see a
+    half-written file.
+    """
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        tmp.write_bytes(pydantic_core.to_json(value, indent=2))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
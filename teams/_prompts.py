@@ -0,0 +1,70 @@
+"""Shared, memoized access to the prompt files in prompts/, plus the output
+rules and schemas every JSON-emitting agent appends to its instruction."""
+import functools
+import json
+import re
+import string
+from pathlib import Path
+from typing import Any
+
+from google.adk.agents.readonly_context import ReadonlyContext
+
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+
+@functools.lru_cache(maxsize=None)
+def read_prompt(filename: str) -> str:
+    """Return the text of prompts/<filename>, or "" if the file is missing.
+
+    Cached per process, so agents sharing a prompt file read it once.
+    """
+    path = PROMPTS_DIR / filename
+    return path.read_text() if path.exists() else ""
+
+
+# Appended once to every JSON-emitting agent's prompt in place of the
+# per-agent boilerplate ("Output is valid JSON only", full skeletons, …).
+SELF_CHECK_RULES = """
+OUTPUT: exactly one JSON object matching OUTPUT SCHEMA — no prose, no code fences,
+every "..." replaced with real content. Verify each CHECK item before answering.
+"""
+
+_BLANK_RUNS = re.compile(r"\n{3,}")
+
+
+def compress(text: str) -> str:
+    """Strip trailing whitespace and collapse runs of blank lines."""
+    text = "\n".join(line.rstrip() for line in text.strip().splitlines())
+    return _BLANK_RUNS.sub("\n\n", text) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def _schemas() -> dict:
+    sections = re.findall(r"^## (\w+)\n+```json\n(.*?)\n```", read_prompt("schemas.md"), re.M | re.S)
+    return {name: json.dumps(json.loads(body), separators=(",", ":")) for name, body in sections}
+
+
+def schema(name: str) -> str:
+    """Single-line JSON for the named output schema in prompts/schemas.md."""
+    return _schemas()[name]
+
+
+class StateTemplate:
+    """ADK instruction provider that fills ``$name`` fields from session state.
+
+    For the short per-call tail of an instruction whose static prefix lives in
+    ``static_instruction``. The template is parsed once at import; each call
+    is a single ``string.Template.substitute`` over the tail, and ADK skips its
+    own ``{name}`` regex pass for providers, so literal braces need no escaping.
+    A missing state key raises KeyError, as ADK's own injection does.
+    """
+
+    def __init__(self, text: str):
+        self.template = string.Template(text)
+
+    def __call__(self, ctx: ReadonlyContext) -> str:
+        return self.template.substitute(ctx.state)
+
+    def render(self, **values: Any) -> str:
+        """Fill the template from keyword values instead of session state."""
+        return self.template.substitute(values)
@@ -0,0 +1,82 @@
+"""Disk-cached wrapper for agents whose output rarely changes between runs."""
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent, InvocationContext
+from google.adk.events import Event, EventActions
+
+from teams._output import parse_json_output, write_json
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(*parts: str) -> str:
+    """SHA-256 over the prompt text an agent's output depends on."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class CachedOutputAgent(BaseAgent):
+    """Runs its single sub-agent only when the on-disk copy of its output is stale.
+
+    The cache file holds ``{"fingerprint": ..., "<output_key>": ...}``. It is
+    reused when younger than ``ttl_seconds`` (by mtime) and its fingerprint
+    matches — i.e. the prompts behind the output haven't changed. Otherwise
+    the sub-agent runs and its ``output_key`` value is written back atomically
+    — but only if it parses as a JSON object, so a refusal or malformed output
+    is retried on the next run instead of being reused for the whole TTL.
+    """
+
+    output_key: str
+    cache_path: Path
+    fingerprint: str
+    ttl_seconds: float = 7 * 24 * 3600
+
+    def _load(self):
+        try:
+            if time.time() - self.cache_path.stat().st_mtime > self.ttl_seconds:
+                return None
+            cached = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("fingerprint") != self.fingerprint:
+            return None
+        return cached.get(self.output_key)
+
+    def _store(self, value) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.cache_path, {"fingerprint": self.fingerprint, self.output_key: value})
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        cached = self._load()
+        if cached is not None:
+            logger.info("Using cached %s from %s", self.output_key, self.cache_path)
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                actions=EventActions(state_delta={self.output_key: cached}),
+            )
+            return
+
+        async for event in self.sub_agents[0].run_async(ctx):
+            yield event
+
+        value = ctx.session.state.get(self.output_key)
+        try:
+            parsed = parse_json_output(value)
+        except ValueError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            logger.warning("Not caching %s: output is not a JSON object", self.output_key)
+            return
+        try:
+            self._store(value)
+        except OSError as exc:
+            logger.warning("Could not cache %s to %s: %s", self.output_key, self.cache_path, exc)
@@ -7,11 +7,11 @@ Agents:
 """
 from google.adk.agents import LlmAgent, SequentialAgent
 
-from tools.exa_tools import exa_search_companies, exa_find_contact
-from tools.hunter_tools import hunter_domain_search, hunter_verify_email
+from tools.exa_tools import exa_search_companies_async, exa_find_contact_async
+from tools.hunter_tools import hunter_domain_search_async, hunter_verify_emails_batch
 
-from model_config import get_llm_model
-CLAUDE_MODEL = get_llm_model()
+from model_config import get_reasoning_model
+CLAUDE_MODEL = get_reasoning_model()
 
 # ---------------------------------------------------------------------------
 # Agent 1: ExaResearchAgent
@@ -19,7 +19,7 @@ CLAUDE_MODEL = get_llm_model()
 exa_research_agent = LlmAgent(
     name="ExaResearchAgent",
     model=CLAUDE_MODEL,
-    tools=[exa_search_companies, exa_find_contact],
+    tools=[exa_search_companies_async, exa_find_contact_async],
     output_key="raw_leads",
     instruction="""
 You are a B2B lead researcher for Backflip Media, a digital advertising agency
@@ -31,7 +31,7 @@ TARGET SEGMENTS:
 - Segment A: B2B expo/tradeshow/conference/summit organizers (500+ attendees)
 - Segment B: Industry associations and professional societies with annual events
 
-Use exa_search_companies to search for leads with these queries (run all 4):
+Use exa_search_companies_async to search for leads with these queries (run all 4):
 1. "B2B tradeshow conference expo organizer association events"
 2. "industry association annual conference summit membership organization"
 3. "professional society trade association recurring events marketing"
@@ -78,7 +78,7 @@ DOMAINS TO SKIP (already in our database — do not research these again):
 hunter_enrichment_agent = LlmAgent(
     name="HunterEnrichmentAgent",
     model=CLAUDE_MODEL,
-    tools=[hunter_domain_search, hunter_verify_email, exa_find_contact],
+    tools=[hunter_domain_search_async, hunter_verify_emails_batch, exa_find_contact_async],
     output_key="enriched_leads",
     instruction="""
 You are a contact enrichment specialist. For each company in {raw_leads},
@@ -86,13 +86,15 @@ find the best decision-maker contact using Hunter.io and Exa as fallback.
 
 PROCESS FOR EACH LEAD:
 1. Extract the domain from the website URL
-2. Call hunter_domain_search(domain=<domain>, limit=5)
+2. Call hunter_domain_search_async(domain=<domain>, limit=5) — issue the calls
+   for all leads in the same turn; they run concurrently
 3. From results, prioritize contacts with these titles (in order):
    VP Marketing, Director of Events, CMO, Executive Director,
    Membership Director, Director of Communications, Head of Marketing
-4. If a contact's verified field is False, call hunter_verify_email(email=<email>)
-5. FALLBACK: If hunter_domain_search returns no contacts, call
-   exa_find_contact(company_name=<name>, domain=<domain>) to find clues
+4. Collect every contact whose verified field is False and check them all with
+   ONE hunter_verify_emails_batch(emails=[...]) call
+5. FALLBACK: If hunter_domain_search_async returns no contacts, call
+   exa_find_contact_async(company_name=<name>, domain=<domain>) to find clues
 
 IMPORTANT: Only include contacts with verified=True or score >= 70 from Hunter.
 
@@ -9,8 +9,8 @@ HARD GATE:
   ConversationalVoiceAgent checks call_permission_granted == True before ANY action.
   If not True, it outputs SKIPPED and stops. No exceptions.
 """
-import os
-from pathlib import Path
+import functools
+from string import Template
 
 from google.adk.agents import LlmAgent, SequentialAgent
 
@@ -21,105 +21,40 @@ from tools.elevenlabs_tools import (
 )
 from tools.calendar_tools import get_free_slots, create_event, get_event
 
-from model_config import get_llm_model
-CLAUDE_MODEL = get_llm_model()
+from model_config import get_reasoning_model
+from teams._prompts import read_prompt
+CLAUDE_MODEL = get_reasoning_model()
+
+
+@functools.cache
+def _voice_agent_instruction() -> str:
+    """Render the ConversationalVoiceAgent instruction once per process.
+
+    The raw prompt lives in prompts/conversational_voice_agent.md with
+    ``$objection_handling`` as its only placeholder, so ADK's own
+    ``{state_key}`` references need no brace escaping.
+    """
+    template = Template(read_prompt("conversational_voice_agent.md"))
+    return template.substitute(objection_handling=read_prompt("objection_handling.md"))
 
-_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
-OBJECTION_HANDLING = (_PROMPTS_DIR / "objection_handling.md").read_text()
 
 # ---------------------------------------------------------------------------
 # Agent 1: ConversationalVoiceAgent
 # ---------------------------------------------------------------------------
-conversational_voice_agent = LlmAgent(
-    name="ConversationalVoiceAgent",
-    model=CLAUDE_MODEL,
-    tools=[
-        elevenlabs_create_conv_agent,
-        elevenlabs_initiate_call,
-        elevenlabs_get_call_status,
-        get_free_slots,
-    ],
-    output_key="call_outcome",
-    instruction=f"""
-You are the voice campaign manager for Backflip Media.
-
-══════════════════════════════════════════════════════════
-HARD GATE — READ FIRST, ALWAYS:
-Check {"{call_permission_record}"}.call_permission_granted.
-
-If call_permission_granted is NOT exactly True:
-  Return immediately:
-  {{{{ "lead_id": "...", "call_status": "SKIPPED",
-       "event_id": null, "next_action": "awaiting_permission",
-       "reason": "No call permission on record" }}}}
-  DO NOT call any tools. DO NOT proceed past this check.
-══════════════════════════════════════════════════════════
-
-IF call_permission_granted == True, proceed:
-
-STEP 1 — Configure the ElevenLabs agent (call elevenlabs_create_conv_agent):
-  agent_name: "Backflip Media Scheduler"
-  first_message: "Hi {{contact_name}}, this is calling on behalf of Backflip Media
-    and Declan — you'd mentioned in your email you were open to a quick call.
-    Is now still an okay time for a few minutes?"
-  system_prompt: |
-    You are a professional scheduler calling on behalf of Declan, CEO of Backflip Media,
-    a digital advertising agency that specializes in B2B events and associations.
-    The prospect has already granted permission for this call via email.
-
-    Your ONLY goal: find a 30-minute time slot that works for the prospect
-    to meet with Declan. Book it immediately if they agree.
-
-    Call context:
-    - Company: {{company_name}}
-    - Contact: {{contact_name}}
-    - Why Declan wants to connect: {{why_fit}}
-
-    OBJECTION HANDLING:
-    {OBJECTION_HANDLING}
-
-    When they agree to a time:
-    - Call get_free_slots() to confirm availability
-    - Confirm the slot verbally
-    - Note the agreed time to return in your output
-
-    Keep the call under 5 minutes. Never hard-sell. Always graceful exit.
-
-STEP 2 — Initiate the call (call elevenlabs_initiate_call):
-  agent_id: <from step 1>
-  phone_number: {{contact_phone}} (from call_permission_record — skip if not available)
-  metadata: {{
-    "contact_name": "{{contact_name}}",
-    "company_name": "{{company_name}}",
-    "lead_id": "{{lead_id}}"
-  }}
-
-STEP 3 — Check call outcome (call elevenlabs_get_call_status after a delay):
-  Interpret the status:
-  - Call connected and time agreed → call_status: "BOOKED"
-  - Call connected, no time agreed → call_status: "RESCHEDULED" or "DECLINED"
-  - No answer → call_status: "NO_ANSWER"
-
-Return ONLY valid JSON:
-{{
-  "lead_id": "...",
-  "call_status": "BOOKED|NO_ANSWER|RESCHEDULED|DECLINED|SKIPPED",
-  "agreed_slot": {{
-    "start_datetime": "ISO datetime or null",
-    "end_datetime": "ISO datetime or null"
-  }},
-  "event_id": null,
-  "next_action": "confirm_booking|email_fallback|nurture|done",
-  "reason": "optional note"
-}}
+def _build_conversational_voice_agent() -> LlmAgent:
+    return LlmAgent(
+        name="ConversationalVoiceAgent",
+        model=CLAUDE_MODEL,
+        tools=[
+            elevenlabs_create_conv_agent,
+            elevenlabs_initiate_call,
+            elevenlabs_get_call_status,
+            get_free_slots,
+        ],
+        output_key="call_outcome",
+        instruction=_voice_agent_instruction(),
+    )
 
-SELF-CHECK:
-- [ ] HARD GATE was checked first
-- [ ] call_status is one of the 5 valid values
-- [ ] If SKIPPED, no tools were called
-- [ ] Output is valid JSON only
-""",
-)
 
 # ---------------------------------------------------------------------------
 # Agent 2: CalendarProposalAgent
@@ -238,17 +173,24 @@ SELF-CHECK:
 # ---------------------------------------------------------------------------
 # Team: MeetingBookingTeam (SequentialAgent)
 # ---------------------------------------------------------------------------
-meeting_booking_team = SequentialAgent(
-    name="MeetingBookingTeam",
-    sub_agents=[
-        conversational_voice_agent,
-        calendar_proposal_agent,
-        confirmation_agent,
-    ],
-    description=(
-        "Places a live ElevenLabs call ONLY when explicit call permission is on record "
-        "(hard gate: call_permission_granted == True). Falls back to email scheduling "
-        "on no-answer. Creates a verified Google Calendar event with Meet link and "
-        "sends a warm confirmation email when a slot is confirmed."
-    ),
-)
+@functools.cache
+def build_meeting_booking_team() -> SequentialAgent:
+    """Build MeetingBookingTeam on first use.
+
+    Deferred so that importing this module (e.g. for the other pipeline
+    stages) does not read the objection-handling prompt from disk.
+    """
+    return SequentialAgent(
+        name="MeetingBookingTeam",
+        sub_agents=[
+            _build_conversational_voice_agent(),
+            calendar_proposal_agent,
+            confirmation_agent,
+        ],
+        description=(
+            "Places a live ElevenLabs call ONLY when explicit call permission is on record "
+            "(hard gate: call_permission_granted == True). Falls back to email scheduling "
+            "on no-answer. Creates a verified Google Calendar event with Meet link and "
+            "sends a warm confirmation email when a slot is confirmed."
+        ),
+    )
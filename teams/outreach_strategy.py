@@ -1,283 +1,484 @@
 """Outreach Strategy Team — Stage 2 of the Backflip Media pipeline.
 
 Agents:
-  1. ICPProfilerAgent       — builds Backflip Media's ICP + messaging framework (runs once)
+  1. ICPProfilerAgent       — builds Backflip Media's ICP + messaging framework
+                               (cached to output/icp_profile.json for 7 days)
   2. CompanyResearchAgent   — deep-dives each lead for personalization hooks
   3. EmailCopywriterAgent   — writes personalized 3-touch email sequences
-  4. SequenceBuilderAgent   — assembles sequences into structured campaign JSON
+  4. SequenceBuilderAgent   — validates sequences and assembles the campaign JSON
+                               (pydantic, no LLM call)
+
+Agents 2 and 3 run as a per-lead chain, fanned out concurrently across all
+qualified leads by PerLeadOutreachAgent.
 """
+import asyncio
 import json
-import os
+import logging
 from pathlib import Path
-
-from google.adk.agents import LlmAgent, SequentialAgent
-
-from tools.exa_tools import exa_search_companies, exa_find_contact
-from tools.context_harness_tools import ctx_search
-
-from model_config import get_llm_model
-CLAUDE_MODEL = get_llm_model()
+from typing import Any, AsyncGenerator
+
+from google.adk.agents import BaseAgent, InvocationContext, LlmAgent, SequentialAgent
+from google.adk.events import Event, EventActions
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai.types import Content, Part
+from pydantic import ValidationError
+
+from tools.exa_tools import exa_find_contact_async
+from tools.perplexity_tools import pplx_search_multi, pplx_search_multi_async
+from tools.batch_copywriter import BatchProcessor, build_request
+from tools.context_harness_tools import ctx_search_async
+
+from schemas import CampaignOutput, EmailSequence
+from model_config import ANTHROPIC_MODEL, active_provider, get_reasoning_model
+from teams._output import parse_json_output
+from teams.cached_agent import CachedOutputAgent, fingerprint
+from teams._prompts import SELF_CHECK_RULES, StateTemplate, compress, read_prompt, schema
+CLAUDE_MODEL = get_reasoning_model()
+# For agents whose static_instruction carries the multi-KB prompt files: the
+# system prefix is cache-marked so repeat calls (one per lead) reuse it.
+CACHED_CLAUDE_MODEL = get_reasoning_model(cache_system_prompt=True)
+
+logger = logging.getLogger(__name__)
 
 # Load prompt files at import time so agents have full context
-_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
-
-def _read_prompt(filename: str) -> str:
-    path = _PROMPTS_DIR / filename
-    return path.read_text() if path.exists() else ""
-
-ICP_CONTEXT = _read_prompt("icp_profiler.md")
-EMAIL_COPYWRITER_SYSTEM = _read_prompt("email_copywriter.md")
+ICP_CONTEXT = read_prompt("icp_profiler.md")
+EMAIL_COPYWRITER_SYSTEM = read_prompt("email_copywriter.md")
 
 # ---------------------------------------------------------------------------
 # Agent 1: ICPProfilerAgent
 # ---------------------------------------------------------------------------
-icp_profiler_agent = LlmAgent(
-    name="ICPProfilerAgent",
-    model=CLAUDE_MODEL,
-    tools=[exa_search_companies],
-    output_key="icp_profile",
-    instruction=f"""
+# Static (cached) system prefix: persona + ICP context from disk.
+ICP_STATIC_INSTRUCTION = compress(f"""
 You are a go-to-market strategist for Backflip Media.
 
 WHAT YOU ALREADY KNOW ABOUT BACKFLIP MEDIA:
 {ICP_CONTEXT}
+{SELF_CHECK_RULES}
+""")
 
+ICP_TASK_INSTRUCTION = compress(f"""
 YOUR TASK:
-Augment the above with fresh research. Use exa_search_companies to search for:
+Augment the above with fresh research. Call pplx_search_multi ONCE with all
+three queries:
 1. "B2B event organizer digital advertising pain points LinkedIn Meta Google ads"
 2. "industry association conference marketing digital ad strategy ROI"
 3. "tradeshow expo paid advertising registration ticket sales conversion"
 
-From the search results, extract and add:
+From the results, extract:
 - The 3 most common digital ad pain points for event organizers
 - The 3 most common pain points for associations
 - Key metrics these orgs care about (ROAS, cost-per-registration, membership growth rate)
 - Platforms they most commonly use or should be using
 
-Then write a complete ICP summary as a JSON object:
-{{
-  "company": "Backflip Media",
-  "value_proposition": "...",
-  "segment_a_pain_points": ["...", "...", "..."],
-  "segment_b_pain_points": ["...", "...", "..."],
-  "key_metrics": ["...", "..."],
-  "platforms": ["LinkedIn Ads", "Meta Ads", "Google Ads", "..."],
-  "tone": "confident, collaborative, peer-to-peer",
-  "proof_points": ["...", "..."],
-  "summary": "2-sentence summary of Backflip's positioning"
-}}
-
-SELF-CHECK:
-- [ ] Both segments have pain points
-- [ ] Output is valid JSON only
-""",
+Then write the complete ICP summary.
+
+OUTPUT SCHEMA (icp_profile_v1): {schema("icp_profile_v1")}
+CHECK: both segments have pain points.
+""")
+
+icp_profiler_agent = LlmAgent(
+    name="ICPProfilerAgent",
+    model=CACHED_CLAUDE_MODEL,
+    tools=[pplx_search_multi],
+    output_key="icp_profile",
+    static_instruction=ICP_STATIC_INSTRUCTION,
+    instruction=ICP_TASK_INSTRUCTION,
+)
+
+# The ICP profile only changes when the prompts behind it do, so reuse it
+# across pipeline runs for a week. Delete output/icp_profile.json to force a
+# refresh.
+cached_icp_profiler_agent = CachedOutputAgent(
+    name="CachedICPProfilerAgent",
+    sub_agents=[icp_profiler_agent],
+    output_key="icp_profile",
+    cache_path=Path(__file__).parent.parent / "output" / "icp_profile.json",
+    fingerprint=fingerprint(ICP_STATIC_INSTRUCTION, ICP_TASK_INSTRUCTION),
+    description="Runs ICPProfilerAgent at most once a week (or when its prompts change).",
 )
 
 # ---------------------------------------------------------------------------
 # Agent 2: CompanyResearchAgent
 # ---------------------------------------------------------------------------
-company_research_agent = LlmAgent(
-    name="CompanyResearchAgent",
-    model=CLAUDE_MODEL,
-    tools=[ctx_search, exa_search_companies, exa_find_contact],
-    output_key="researched_leads",
-    instruction="""
-You are a sales researcher. For each lead in {scored_leads}.qualified_leads,
-find a specific, concrete personalization hook.
-
-FOR EACH LEAD:
-1. Use exa_search_companies to search: "[company name] conference event 2025 2026"
-2. Use exa_search_companies to search: "[company name] digital marketing advertising"
-3. Use exa_find_contact to research the primary contact's background
-
-From results, find ONE of these (in priority order):
+COMPANY_RESEARCH_STATIC_INSTRUCTION = compress(f"""
+You are a sales researcher. Find a specific, concrete personalization hook
+for the ONE lead given below.
+
+First check internal history:
+1. ctx_search_async("email history [company name]") — if we've contacted this
+   org before, do NOT repeat the same hook.
+2. ctx_search_async("personalization hooks that converted for [event_type] organizers")
+   — reuse winning patterns. Empty results are fine; carry on.
+
+Then research:
+3. Call pplx_search_multi_async ONCE with both queries:
+     "[company name] conference event 2025 2026"
+     "[company name] digital marketing advertising"
+4. Use exa_find_contact_async to research the primary contact's background
+
+Find ONE of these (in priority order):
   a) An upcoming or recently announced event (name + date if available)
   b) A growth signal (new hires, expanded event, new chapter/region)
   c) A visible pain point (hiring for marketing roles, poor ad presence, manual processes)
   d) A recent achievement worth referencing ("congrats on 20 years")
 
-Set personalization_hook to a 1-sentence observation. Examples:
+personalization_hook is a 1-sentence observation, e.g.:
   "Saw your 2026 Annual Summit registration just opened — congrats on expanding to a second city."
   "You're running three regional expos this year — that's a lot of ad campaigns to coordinate."
-  "Noticed you're hiring a Marketing Manager — looks like you're scaling the events team."
-
-Return the full qualified_leads list with personalization_hook added to each.
-Return ONLY the JSON array directly (no wrapper object):
-[
-    {{
-      "name": "...",
-      "website": "...",
-      "description": "...",
-      "event_type": "...",
-      "estimated_event_size": "...",
-      "why_fit": "...",
-      "contacts": [...],
-      "score": 75,
-      "score_dimensions": {{...}},
-      "personalization_hook": "Specific observation about their events or situation."
-    }}
-]
-
-BEFORE searching Exa, check internal history for each lead:
-4. ctx_search("email history [company name]") — if we've contacted this org
-   before, do NOT repeat the same hook.
-5. ctx_search("personalization hooks that converted for [event_type] organizers")
-   — use winning patterns from past campaigns.
-If ctx_search returns empty results, proceed with Exa as normal.
-
-SELF-CHECK:
-- [ ] Every lead has a personalization_hook (not null, not generic)
-- [ ] Hooks reference the company by name or a specific event
-- [ ] Output is valid JSON only
-""",
+
+Return the input lead (all its fields) with personalization_hook added — one
+object, no wrapper or array.
+
+OUTPUT SCHEMA (researched_lead_v1): {schema("researched_lead_v1")}
+CHECK: personalization_hook is set, not generic, and names the company or a specific event.
+{SELF_CHECK_RULES}
+""")
+
+company_research_agent = LlmAgent(
+    name="CompanyResearchAgent",
+    model=CACHED_CLAUDE_MODEL,
+    tools=[ctx_search_async, pplx_search_multi_async, exa_find_contact_async],
+    output_key="researched_lead",
+    static_instruction=COMPANY_RESEARCH_STATIC_INSTRUCTION,
+    instruction=StateTemplate("LEAD TO RESEARCH:\n$lead\n"),
 )
 
 # ---------------------------------------------------------------------------
 # Agent 3: EmailCopywriterAgent
 # ---------------------------------------------------------------------------
-email_copywriter_agent = LlmAgent(
-    name="EmailCopywriterAgent",
-    model=CLAUDE_MODEL,
-    tools=[],
-    output_key="email_sequences",
-    instruction=f"""
+# Static (cached) system prefix: copywriter guide + touch specs + format.
+EMAIL_COPYWRITER_STATIC_INSTRUCTION = compress(f"""
 {EMAIL_COPYWRITER_SYSTEM}
 
 ---
 
-ICP CONTEXT:
-{{icp_profile}}
+YOUR TASK:
+Write the 3-touch sequence for the lead below, to the PRIMARY contact (first in
+contacts). Goal: a discovery call with Declan (CEO).
+
+Touch 1 (Day 1): open with the personalization_hook, then one value sentence for
+  their segment — A (event organizer): "fill rooms / drive registrations with
+  targeted digital ads"; B (association): "grow membership and drive event
+  registrations from one strategy". CTA: "Would it be worth 15 minutes to see if
+  we can help?"
+Touch 2 (Day 5): a fresh digital-ads insight for their segment, the offer from a
+  new angle, same CTA reworded.
+Touch 3 (Day 10): warm breakup, no hard sell — "Last note from me — if the timing
+  ever makes sense, we'd love to help [Company] make [upcoming event / their next
+  event] their biggest yet."
+
+OUTPUT SCHEMA (sequence_v1): {schema("sequence_v1")}
+"emails" holds all 3 touches (send_day 1/5/10); lead_id is copied from the
+LEAD TO WRITE FOR line.
+CHECK: the Self-Check list above; exactly 3 touches.
+{SELF_CHECK_RULES}
+""")
 
-LEADS TO WRITE FOR (iterate over each lead in this array):
-{{researched_leads}}
+email_copywriter_agent = LlmAgent(
+    name="EmailCopywriterAgent",
+    model=CACHED_CLAUDE_MODEL,
+    tools=[],
+    output_key="email_sequence",
+    static_instruction=EMAIL_COPYWRITER_STATIC_INSTRUCTION,
+    # Dynamic tail: ICP profile and per-lead data, filled from session state.
+    instruction=StateTemplate("""
+ICP CONTEXT:
+$icp_profile
 
-YOUR TASK:
-Write a 3-touch email sequence for each lead. Each sequence targets the PRIMARY
-contact (first in the contacts list). Outreach is FROM Backflip Media; goal is
-a discovery call with Declan (CEO).
-
-TOUCH SPECIFICATIONS:
-  Touch 1 (Day 1) — Cold intro:
-    - Open with the lead's personalization_hook (1 sentence)
-    - 1 sentence value prop tailored to their segment:
-        Segment A (event organizer): "fill rooms / drive registrations with targeted digital ads"
-        Segment B (association): "grow membership and drive event registrations from one strategy"
-    - CTA: "Would it be worth 15 minutes to see if we can help?"
-    - Subject: <7 words, specific to their world (no clickbait)
-    - Max 100 words body
-
-  Touch 2 (Day 5) — Value add:
-    - Lead with a fresh insight about digital ads for their segment (not repeating Touch 1)
-    - Restate offer from a different angle
-    - Same CTA, different wording
-    - Max 80 words body
-
-  Touch 3 (Day 10) — Warm breakup:
-    - Short, warm, no hard sell
-    - Reference their specific upcoming event or situation
-    - "Last note from me — if the timing ever makes sense, we'd love to help [Company]
-       make [upcoming event / their next event] their biggest yet."
-    - Max 60 words body
-
-Return ONLY valid JSON:
-{{
-  "sequences": [
-    {{
-      "lead_id": "lead-001",
-      "lead_name": "Company Name",
-      "contacts": ["jane@example.com"],
-      "emails": [
-        {{
-          "touch_number": 1,
-          "send_day": 1,
-          "subject": "Short subject here",
-          "body": "Email body text..."
-        }},
-        {{
-          "touch_number": 2,
-          "send_day": 5,
-          "subject": "...",
-          "body": "..."
-        }},
-        {{
-          "touch_number": 3,
-          "send_day": 10,
-          "subject": "...",
-          "body": "..."
-        }}
-      ]
-    }}
-  ]
-}}
-
-SELF-CHECK:
-- [ ] Touch 1 for every lead opens with THEIR personalization_hook
-- [ ] Every lead has exactly 3 touches
-- [ ] No two leads share the same Touch 1 opening sentence
-- [ ] All subject lines are under 7 words
-- [ ] Word counts are within limits (100/80/60)
-- [ ] Output is valid JSON only
-""",
+LEAD TO WRITE FOR (id $lead_id):
+$researched_lead
+"""),
 )
 
 # ---------------------------------------------------------------------------
-# Agent 4: SequenceBuilderAgent
+# Per-lead fan-out: CompanyResearchAgent → EmailCopywriterAgent
 # ---------------------------------------------------------------------------
-sequence_builder_agent = LlmAgent(
-    name="SequenceBuilderAgent",
-    model=CLAUDE_MODEL,
-    tools=[],
-    output_key="campaign_json",
-    instruction="""
-You are a campaign assembler. Take {email_sequences} and build the final campaign JSON.
+lead_outreach_chain = SequentialAgent(
+    name="LeadOutreachChain",
+    sub_agents=[company_research_agent, email_copywriter_agent],
+    description="Researches one lead and writes its 3-touch email sequence.",
+)
 
-YOUR TASK:
-1. Validate the sequences:
-   - Every lead has exactly 3 email touches
-   - Every touch has: touch_number, send_day, subject, body
-   - No empty subject or body fields
-   - Report any validation errors in a "validation_errors" list
-
-2. Enrich each sequence with:
-   - send_schedule: {{"touch_1": 1, "touch_2": 5, "touch_3": 10}}
-   - unsubscribe_footer: "To unsubscribe from these emails, reply with 'unsubscribe'."
-
-3. Assemble final campaign object.
-
-Return ONLY valid JSON:
-{{
-  "campaign_path": "output/campaign.json",
-  "lead_count": N,
-  "validation_errors": [],
-  "sequences": [
-    {{
-      "lead_id": "...",
-      "lead_name": "...",
-      "contacts": ["..."],
-      "send_schedule": {{"touch_1": 1, "touch_2": 5, "touch_3": 10}},
-      "unsubscribe_footer": "To unsubscribe from these emails, reply with 'unsubscribe'.",
-      "emails": [...]
-    }}
-  ]
-}}
-
-SELF-CHECK:
-- [ ] lead_count matches the number of sequences
-- [ ] validation_errors is empty (fix any issues found before responding)
-- [ ] Every sequence has send_schedule and unsubscribe_footer
-- [ ] Output is valid JSON only
-""",
+
+def _validated(sequence: dict) -> dict:
+    """Return sequence unchanged, raising ValueError if it fails EmailSequence.
+
+    Run per lead as each sequence arrives, so a malformed one is retried
+    (or rewritten per lead after a batch) instead of being dropped later by
+    SequenceBuilderAgent.
+    """
+    EmailSequence.model_validate(sequence)
+    return sequence
+
+
+class PerLeadOutreachAgent(BaseAgent):
+    """Runs ``lead_chain`` once per qualified lead, concurrently.
+
+    Each lead gets its own session seeded with just that lead (plus the ICP
+    profile), so prompts no longer carry the full leads array and wall time
+    is bounded by the slowest lead rather than the sum of all of them.
+    Concurrency is capped by ``max_concurrency`` to stay inside provider
+    rate limits. Each sequence is schema-checked as soon as it is written,
+    so an invalid one counts as a failure and is retried; a lead that still
+    fails after ``max_retries`` is logged and left out of the campaign. A
+    partial progress event is streamed as each lead finishes.
+
+    With ``batch_threshold`` or more leads on the Anthropic API, only
+    ``research_agent`` runs per lead; the sequences are then written in one
+    Message Batch (half price, latency-insensitive) from ``copywriter_agent``'s
+    prompts. If the batch fails, those leads fall back to per-lead copywriting.
+
+    Writes ``researched_leads`` (list) and ``email_sequences``
+    (``{"sequences": [...]}``) to session state for SequenceBuilderAgent as
+    plain Python objects — both stay in-process, so there is no reason to
+    encode them to JSON only for the builder to decode them again.
+    """
+
+    lead_chain: BaseAgent
+    research_agent: BaseAgent
+    copywriter_agent: LlmAgent
+    max_concurrency: int = 10
+    max_retries: int = 2
+    batch_threshold: int = 10
+
+    async def _run_in_session(self, agent: BaseAgent, state: dict, message: str) -> dict:
+        app_name = f"backflip_{agent.name.lower()}"
+        session_service = InMemorySessionService()
+        session = await session_service.create_session(
+            app_name=app_name,
+            user_id="backflip_pipeline",
+            state=state,
+        )
+        runner = Runner(
+            agent=agent,
+            app_name=app_name,
+            session_service=session_service,
+        )
+        async for _ in runner.run_async(
+            user_id="backflip_pipeline",
+            session_id=session.id,
+            new_message=Content(role="user", parts=[Part(text=message)]),
+        ):
+            pass
+
+        session = await session_service.get_session(
+            app_name=app_name,
+            user_id="backflip_pipeline",
+            session_id=session.id,
+        )
+        return session.state
+
+    async def _with_retries(self, sem: asyncio.Semaphore, label: str, run) -> Any:
+        async with sem:
+            for attempt in range(1, self.max_retries + 2):
+                try:
+                    return await run()
+                except Exception as exc:
+                    logger.warning("%s failed on attempt %d: %s", label, attempt, exc)
+        return None
+
+    async def _run_lead(self, lead: dict, lead_id: str, icp_profile: Any) -> tuple[dict, dict]:
+        state = await self._run_in_session(
+            self.lead_chain,
+            {"lead": json.dumps(lead), "lead_id": lead_id, "icp_profile": icp_profile},
+            json.dumps(lead),
+        )
+        return (
+            parse_json_output(state["researched_lead"]),
+            _validated(parse_json_output(state["email_sequence"])),
+        )
+
+    async def _research_lead(self, lead: dict, lead_id: str) -> dict:
+        state = await self._run_in_session(
+            self.research_agent,
+            {"lead": json.dumps(lead), "lead_id": lead_id},
+            json.dumps(lead),
+        )
+        return parse_json_output(state["researched_lead"])
+
+    async def _write_lead(self, researched: dict, lead_id: str, icp_profile: Any) -> dict:
+        state = await self._run_in_session(
+            self.copywriter_agent,
+            {"researched_lead": json.dumps(researched), "lead_id": lead_id, "icp_profile": icp_profile},
+            json.dumps(researched),
+        )
+        return _validated(parse_json_output(state["email_sequence"]))
+
+    async def _write_batch(self, researched: dict[str, dict], icp_profile: Any) -> dict[str, dict]:
+        model = ANTHROPIC_MODEL.removeprefix("anthropic/")
+        requests = [
+            build_request(
+                lead_id,
+                model,
+                self.copywriter_agent.static_instruction,
+                self.copywriter_agent.instruction.render(
+                    icp_profile=icp_profile,
+                    lead_id=lead_id,
+                    researched_lead=json.dumps(lead),
+                ),
+            )
+            for lead_id, lead in researched.items()
+        ]
+        processor = BatchProcessor(
+            on_progress=lambda counts: logger.info("Copywriter batch progress: %s", counts),
+        )
+        texts = await processor.run(requests)
+        sequences = {}
+        for lead_id, text in texts.items():
+            try:
+                sequences[lead_id] = _validated(parse_json_output(text))
+            except ValueError as exc:
+                logger.warning("Batch sequence for %s is invalid: %s", lead_id, exc)
+        return sequences
+
+    async def _run_batched(self, leads: list, icp_profile: Any, sem: asyncio.Semaphore) -> list:
+        lead_ids = [f"lead-{i + 1:03d}" for i in range(len(leads))]
+        researched_list = await asyncio.gather(*(
+            self._with_retries(
+                sem,
+                f"Research for {lead_id} ({lead.get('name', '?')})",
+                lambda lead=lead, lead_id=lead_id: self._research_lead(lead, lead_id),
+            )
+            for lead_id, lead in zip(lead_ids, leads)
+        ))
+        researched = {lid: r for lid, r in zip(lead_ids, researched_list) if r is not None}
+
+        try:
+            sequences = await self._write_batch(researched, icp_profile)
+        except Exception as exc:
+            logger.warning("Copywriter batch failed, writing per lead instead: %s", exc)
+            sequences = {}
+
+        missing = [lid for lid in researched if lid not in sequences]
+        retried = await asyncio.gather(*(
+            self._with_retries(
+                sem,
+                f"Copywriting for {lead_id}",
+                lambda lead_id=lead_id: self._write_lead(researched[lead_id], lead_id, icp_profile),
+            )
+            for lead_id in missing
+        ))
+        sequences.update({lid: seq for lid, seq in zip(missing, retried) if seq is not None})
+        return [(researched[lid], sequences[lid]) for lid in researched if lid in sequences]
+
+    def _progress(self, ctx: InvocationContext, text: str) -> Event:
+        # partial=True: streamed to the runner's caller but not persisted to
+        # the session, and never mistaken for the team's final response.
+        return Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            partial=True,
+            content=Content(role="model", parts=[Part(text=text)]),
+        )
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        scored = parse_json_output(ctx.session.state.get("scored_leads") or {})
+        leads = scored.get("qualified_leads", []) if isinstance(scored, dict) else []
+        icp_profile = ctx.session.state.get("icp_profile", "")
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        if len(leads) >= self.batch_threshold and active_provider() == "anthropic":
+            completed = await self._run_batched(leads, icp_profile, sem)
+        else:
+            tasks = [
+                asyncio.ensure_future(self._with_retries(
+                    sem,
+                    f"Outreach for lead-{i + 1:03d} ({lead.get('name', '?')})",
+                    lambda lead=lead, i=i: self._run_lead(lead, f"lead-{i + 1:03d}", icp_profile),
+                ))
+                for i, lead in enumerate(leads)
+            ]
+            # Report each lead as it lands rather than after the slowest one.
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                if await task is not None:
+                    yield self._progress(ctx, f"{done}/{len(tasks)} leads done")
+            completed = [t.result() for t in tasks if t.result() is not None]
+
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={
+                "researched_leads": [lead for lead, _ in completed],
+                "email_sequences": {"sequences": [seq for _, seq in completed]},
+            }),
+        )
+
+
+per_lead_outreach_agent = PerLeadOutreachAgent(
+    name="PerLeadOutreachAgent",
+    lead_chain=lead_outreach_chain,
+    research_agent=company_research_agent,
+    copywriter_agent=email_copywriter_agent,
+    description=(
+        "Fans out CompanyResearchAgent + EmailCopywriterAgent once per "
+        "qualified lead, with bounded concurrency."
+    ),
 )
 
+# ---------------------------------------------------------------------------
+# Agent 4: SequenceBuilderAgent
+# ---------------------------------------------------------------------------
+CAMPAIGN_PATH = "output/campaign.json"
+
+
+class SequenceBuilderAgent(BaseAgent):
+    """Validates ``email_sequences`` and assembles the campaign — no LLM call.
+
+    Each sequence is checked against ``schemas.EmailSequence`` (exactly 3
+    touches, non-empty subject/body, ...), which also fills in the default
+    ``send_schedule`` and ``unsubscribe_footer``. Sequences that fail are left
+    out and their pydantic errors recorded in ``validation_errors``.
+
+    Writes ``campaign_json`` (a ``schemas.CampaignOutput`` dict) to state.
+    """
+
+    output_key: str = "campaign_json"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        raw = ctx.session.state.get("email_sequences") or {}
+        try:
+            sequences = (parse_json_output(raw) if isinstance(raw, str) else raw).get("sequences", [])
+        except (ValueError, AttributeError) as exc:
+            logger.error("email_sequences is not a JSON object: %s", exc)
+            sequences = []
+
+        valid: list[EmailSequence] = []
+        errors: list[dict] = []
+        for seq in sequences:
+            try:
+                valid.append(EmailSequence.model_validate(seq))
+            except ValidationError as exc:
+                lead_id = seq.get("lead_id") if isinstance(seq, dict) else None
+                logger.warning("Dropping invalid sequence for lead %s: %s", lead_id, exc)
+                errors.append({
+                    "lead_id": lead_id,
+                    "errors": exc.errors(include_url=False, include_context=False, include_input=False),
+                })
+
+        campaign = CampaignOutput(
+            campaign_path=CAMPAIGN_PATH,
+            lead_count=len(valid),
+            sequences=valid,
+            validation_errors=errors,
+        )
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={self.output_key: campaign.model_dump()}),
+        )
+
+
+sequence_builder_agent = SequenceBuilderAgent(name="SequenceBuilderAgent")
+
 # ---------------------------------------------------------------------------
 # Team: OutreachStrategyTeam (SequentialAgent)
 # ---------------------------------------------------------------------------
 outreach_strategy_team = SequentialAgent(
     name="OutreachStrategyTeam",
     sub_agents=[
-        icp_profiler_agent,
-        company_research_agent,
-        email_copywriter_agent,
+        cached_icp_profiler_agent,
+        per_lead_outreach_agent,
         sequence_builder_agent,
     ],
     description=(
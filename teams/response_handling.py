@@ -1,9 +1,10 @@
 """Response Handling Team — Stage 3 of the Backflip Media pipeline.
 
 Agents:
-  1. ResponseClassifierAgent  — classifies every inbound reply
+  1. ResponseClassifierAgent  — classifies every inbound reply (obvious ones are
+                                 short-circuited by a keyword fast path)
   2. CallPermissionAgent      — drafts call-permission email for INTERESTED leads
-  3. NurtureAgent             — schedules re-contact for NURTURE leads
+  3. NurtureAgent             — schedules re-contact for NURTURE leads (pure Python)
 
 CALL GATE:
   No voice call is ever initiated until:
@@ -12,169 +13,247 @@ CALL GATE:
     c) The lead replies granting permission (second INTERESTED classification)
   Only then is call_permission_granted set to True and passed to MeetingBookingTeam.
 """
-from pathlib import Path
+import json
+import logging
+from typing import AsyncGenerator
 
-from google.adk.agents import LlmAgent, SequentialAgent
+from google.adk.agents import BaseAgent, InvocationContext, LlmAgent
+from google.adk.events import Event, EventActions
 
-from tools.context_harness_tools import ctx_search
-from model_config import get_llm_model
-CLAUDE_MODEL = get_llm_model()
+from tools.context_harness_tools import ctx_search_async
+from tools.nurture_scheduler import compute_recontact_date, find_timing_cue
+from tools.reply_classifier_fast import classify_fast
+from model_config import get_reasoning_model, get_utility_model
+from teams._output import parse_json_output
+from teams._prompts import SELF_CHECK_RULES, StateTemplate, compress, read_prompt, schema
+# Picking one of four labels is a utility-tier task; the call-permission email
+# goes to a prospect, so it stays on the reasoning tier.
+UTILITY_MODEL = get_utility_model(cache_system_prompt=True)
+CACHED_CLAUDE_MODEL = get_reasoning_model(cache_system_prompt=True)
 
-_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
-CALL_PERMISSION_TEMPLATE = (_PROMPTS_DIR / "call_permission_email.md").read_text()
+logger = logging.getLogger(__name__)
+
+CALL_PERMISSION_TEMPLATE = read_prompt("call_permission_email.md")
 
 # ---------------------------------------------------------------------------
 # Agent 1: ResponseClassifierAgent
 # ---------------------------------------------------------------------------
-response_classifier_agent = LlmAgent(
-    name="ResponseClassifierAgent",
-    model=CLAUDE_MODEL,
-    tools=[ctx_search],
-    output_key="reply_classification",
-    instruction="""
+RESPONSE_CLASSIFIER_STATIC_INSTRUCTION = compress(f"""
 You are an inbound reply classifier for Backflip Media's outreach campaign.
 
 BEFORE classifying, load conversation context:
-1. ctx_search("email sequence and history lead {lead_id}") — find what touch
+1. ctx_search_async("email sequence and history lead [lead_id]") — find what touch
    they're replying to and what was in that email.
-2. ctx_search("previous replies {lead_id}") — check if this org replied before
+2. ctx_search_async("previous replies [lead_id]") — check if this org replied before
    and what the prior classification was.
 Include this context in your reasoning field.
 
-Classify the inbound reply in {inbound_reply} into EXACTLY ONE of:
-
-  INTERESTED   — clear positive signal; prospect wants to meet, learn more, or chat
-                 Trigger phrases: "sure", "sounds good", "happy to chat", "let's connect",
-                 "tell me more", "let's find a time", "open to it", "yes", "that works"
-
-  NURTURE      — not now but not a hard no; timing or bandwidth issue
-                 Trigger phrases: "try me in Q3", "we're mid-campaign", "check back after",
-                 "not right now", "maybe later", "after our event", "reach out in"
-
-  NOT_FIT      — clear no, wrong org, or irrelevant reply
-                 Trigger phrases: "not interested", "we don't do events", "wrong person",
-                 "remove me", "stop emailing", "we have this covered"
-
-  UNSUBSCRIBE  — explicit opt-out request; must be honored immediately
-                 Trigger phrases: "unsubscribe", "take me off", "stop all emails",
-                 "do not contact", "remove from list"
-
-IMPORTANT — use chain-of-thought:
-  Step 1: Quote the exact phrase(s) that drive the classification
-  Step 2: Explain your reasoning (1 sentence)
-  Step 3: State the classification
-
-Return ONLY valid JSON:
-{{
-  "classification": "INTERESTED|NURTURE|NOT_FIT|UNSUBSCRIBE",
-  "reasoning": "They said 'sure, happy to chat' which is a clear positive signal.",
-  "key_phrase": "sure, happy to chat",
-  "lead_id": "{{lead_id}}"
-}}
-
-SELF-CHECK:
-- [ ] Exactly one classification chosen
-- [ ] key_phrase is a direct quote from the reply
-- [ ] Output is valid JSON only
-""",
+Classify the INBOUND REPLY below into EXACTLY ONE of:
+- INTERESTED: clear positive signal; wants to meet, learn more, or chat.
+  e.g. "sure", "sounds good", "happy to chat", "let's connect", "tell me more",
+  "let's find a time", "open to it", "yes", "that works"
+- NURTURE: not now but not a hard no; timing or bandwidth.
+  e.g. "try me in Q3", "we're mid-campaign", "check back after", "not right now",
+  "maybe later", "after our event", "reach out in"
+- NOT_FIT: clear no, wrong org, or irrelevant.
+  e.g. "not interested", "we don't do events", "wrong person", "remove me",
+  "stop emailing", "we have this covered"
+- UNSUBSCRIBE: explicit opt-out; must be honored immediately.
+  e.g. "unsubscribe", "take me off", "stop all emails", "do not contact",
+  "remove from list"
+
+Quote the phrase(s) driving the decision in key_phrase, explain in one
+sentence in reasoning, then set classification. lead_id is the LEAD ID below.
+
+OUTPUT SCHEMA (reply_classification_v1): {schema("reply_classification_v1")}
+CHECK: exactly one classification; key_phrase is a direct quote from the reply.
+{SELF_CHECK_RULES}
+""")
+
+response_classifier_agent = LlmAgent(
+    name="ResponseClassifierAgent",
+    model=UTILITY_MODEL,
+    tools=[ctx_search_async],
+    output_key="reply_classification",
+    static_instruction=RESPONSE_CLASSIFIER_STATIC_INSTRUCTION,
+    instruction=StateTemplate("LEAD ID: $lead_id\n\nINBOUND REPLY:\n$inbound_reply\n"),
+)
+
+
+class FastPathClassifierAgent(BaseAgent):
+    """Classifies obvious replies from trigger phrases; defers the rest.
+
+    Runs ``classify_fast`` on ``inbound_reply`` first. A confident match is
+    written straight to ``reply_classification`` (same JSON shape as the LLM
+    classifier's output) with no model call; anything ambiguous falls through
+    to the wrapped LLM classifier, its only sub-agent.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        fast = classify_fast(str(ctx.session.state.get("inbound_reply", "")))
+        if fast is None:
+            async for event in self.sub_agents[0].run_async(ctx):
+                yield event
+            return
+
+        lead_id = ctx.session.state.get("lead_id", "")
+        logger.info("Fast-path classified reply for %s as %s", lead_id, fast["classification"])
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={
+                "reply_classification": json.dumps({**fast, "lead_id": lead_id}),
+            }),
+        )
+
+
+fast_path_classifier_agent = FastPathClassifierAgent(
+    name="FastPathClassifierAgent",
+    sub_agents=[response_classifier_agent],
+    description=(
+        "Keyword fast path for reply classification; falls back to "
+        "ResponseClassifierAgent for ambiguous replies."
+    ),
 )
 
 # ---------------------------------------------------------------------------
 # Agent 2: CallPermissionAgent
 # ---------------------------------------------------------------------------
-call_permission_agent = LlmAgent(
-    name="CallPermissionAgent",
-    model=CLAUDE_MODEL,
-    tools=[],
-    output_key="call_permission_email",
-    instruction=f"""
+# Static (cached) system prefix: persona + call-permission template + rules.
+CALL_PERMISSION_STATIC_INSTRUCTION = compress(f"""
 You are a follow-up email writer for Backflip Media.
 
-CALL GATE RULE: Only trigger when {{reply_classification}}.classification == "INTERESTED".
-If classification is anything other than INTERESTED, return:
-{{{{ "skipped": true, "reason": "Classification was not INTERESTED", "lead_id": "..." }}}}
-
 TEMPLATE GUIDANCE:
 {CALL_PERMISSION_TEMPLATE}
 
 YOUR TASK (when INTERESTED):
-Draft a warm, 2-3 sentence reply asking for permission to call.
-
-The email MUST:
-1. Acknowledge their positive reply warmly (1 sentence — genuine, not sycophantic)
-2. Ask: "Would it be okay if I gave you a quick call to find a time that works
-   between yourself and our CEO, Declan?"
-3. End with: "Happy to work around your schedule."
-
-The email must NOT:
-- Re-pitch or mention pricing
-- Include links or attachments
-- Be longer than 3 sentences
-
-Return ONLY valid JSON:
-{{
-  "email_draft": "Full email body text",
-  "subject": "Re: [original subject]",
-  "awaiting_call_permission": true,
-  "lead_id": "...",
-  "skipped": false
-}}
-
-SELF-CHECK:
-- [ ] Email is 2-3 sentences exactly
-- [ ] Contains the exact call-permission question about Declan
-- [ ] Does not re-pitch
-- [ ] Output is valid JSON only
-""",
+Draft the call-permission reply exactly per the template above: a warm 1-sentence
+acknowledgment, the call-permission question about Declan verbatim, then
+"Happy to work around your schedule." Nothing else.
+
+OUTPUT SCHEMA (call_permission_v1): {schema("call_permission_v1")}
+CHECK: 2-3 sentences; contains the exact call-permission question about Declan;
+no re-pitch.
+{SELF_CHECK_RULES}
+""")
+
+call_permission_agent = LlmAgent(
+    name="CallPermissionAgent",
+    model=CACHED_CLAUDE_MODEL,
+    tools=[],
+    output_key="call_permission_email",
+    static_instruction=CALL_PERMISSION_STATIC_INSTRUCTION,
+    # Dynamic tail: the gate, filled in with this reply's classification.
+    instruction=StateTemplate("""
+CALL GATE RULE: Only trigger when $reply_classification.classification == "INTERESTED".
+If classification is anything other than INTERESTED, return:
+{ "skipped": true, "reason": "Classification was not INTERESTED", "lead_id": "..." }
+"""),
 )
 
 # ---------------------------------------------------------------------------
 # Agent 3: NurtureAgent
 # ---------------------------------------------------------------------------
-nurture_agent = LlmAgent(
+class NurtureSchedulerAgent(BaseAgent):
+    """Schedules a NURTURE re-contact in Python — no LLM call.
+
+    ``compute_recontact_date`` applies the scheduling rule (1 week after the
+    period the reply points at, or 30 days out without a timing cue), and the
+    note quotes the classifier's ``key_phrase`` so whoever re-contacts knows
+    why the lead asked to wait. Writes the same JSON shape the LLM did.
+    """
+
+    output_key: str = "nurture_schedule"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        reply = str(ctx.session.state.get("inbound_reply", ""))
+        try:
+            verdict = parse_json_output(ctx.session.state.get("reply_classification") or {})
+            key_phrase = verdict.get("key_phrase") or reply
+        except (ValueError, AttributeError):
+            key_phrase = reply
+
+        cue = find_timing_cue(reply)
+        recontact = compute_recontact_date(reply)
+        if cue:
+            note = f'They said "{key_phrase}". Re-contact on {recontact:%B %d, %Y} and reference that timing.'
+        else:
+            note = f'They said "{key_phrase}" with no specific timing. Default 30-day re-contact.'
+
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={
+                self.output_key: json.dumps({
+                    "lead_id": ctx.session.state.get("lead_id", ""),
+                    "recontact_date": recontact.isoformat(),
+                    "recontact_note": note,
+                    "skipped": False,
+                }),
+            }),
+        )
+
+
+nurture_agent = NurtureSchedulerAgent(
     name="NurtureAgent",
-    model=CLAUDE_MODEL,
-    tools=[],
-    output_key="nurture_schedule",
-    instruction="""
-You are a nurture scheduler for Backflip Media.
-
-ONLY trigger when {reply_classification}.classification == "NURTURE".
-If classification is not NURTURE, return:
-{{ "skipped": true, "reason": "Classification was not NURTURE", "lead_id": "..." }}
-
-YOUR TASK (when NURTURE):
-Parse the reply text in {inbound_reply} for timing cues.
-
-TIMING LOGIC:
-  - If a specific time is mentioned ("after our May conference", "Q3", "July"):
-    → Set recontact_date to 1 week AFTER that implied date
-  - If no specific timing:
-    → Set recontact_date to 30 days from today (use ISO format YYYY-MM-DD)
-  - Add a recontact_note reminding what context to reference when re-contacting
-
-Return ONLY valid JSON:
-{{
-  "lead_id": "...",
-  "recontact_date": "YYYY-MM-DD",
-  "recontact_note": "They said they're mid-campaign until May. Re-contact after their spring conference.",
-  "skipped": false
-}}
-
-SELF-CHECK:
-- [ ] recontact_date is a valid YYYY-MM-DD date
-- [ ] recontact_note references the specific reason for the delay
-- [ ] Output is valid JSON only
-""",
+    description="Computes a timing-aware re-contact date for NURTURE replies.",
 )
 
 # ---------------------------------------------------------------------------
-# Team: ResponseHandlingTeam (SequentialAgent)
+# Team: ResponseHandlingTeam (classification router)
 # ---------------------------------------------------------------------------
-response_handling_team = SequentialAgent(
+# Downstream agent name → the classification that gates it.
+_GATES = {
+    "CallPermissionAgent": "INTERESTED",
+    "NurtureAgent": "NURTURE",
+}
+
+
+class ReplyRouterAgent(BaseAgent):
+    """Runs the classifier, then only the downstream agent its verdict needs.
+
+    ``sub_agents`` is ``[classifier, call_permission_agent, nurture_agent]``.
+    INTERESTED runs CallPermissionAgent, NURTURE runs NurtureAgent, and
+    NOT_FIT / UNSUBSCRIBE run neither. Every agent that is not run gets the
+    same ``{"skipped": true, ...}`` JSON its prompt would have produced,
+    written from Python instead of an LLM round-trip.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        classifier, *downstream = self.sub_agents
+        async for event in classifier.run_async(ctx):
+            yield event
+
+        try:
+            verdict = parse_json_output(ctx.session.state.get("reply_classification") or {})
+            classification = verdict.get("classification", "UNKNOWN")
+        except (ValueError, AttributeError):
+            classification = "UNKNOWN"
+        lead_id = ctx.session.state.get("lead_id", "")
+        selected = [a for a in downstream if _GATES[a.name] == classification]
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={
+                agent.output_key: json.dumps({
+                    "skipped": True,
+                    "reason": f"Classification was not {_GATES[agent.name]}",
+                    "lead_id": lead_id,
+                })
+                for agent in downstream
+                if agent not in selected
+            }),
+        )
+
+        for agent in selected:
+            async for event in agent.run_async(ctx):
+                yield event
+
+
+response_handling_team = ReplyRouterAgent(
     name="ResponseHandlingTeam",
     sub_agents=[
-        response_classifier_agent,
+        fast_path_classifier_agent,
         call_permission_agent,
         nurture_agent,
     ],
@@ -0,0 +1,34 @@
+"""Shared pytest fixtures."""
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from pydantic_core import to_json
+
+
+@pytest.fixture
+def make_resp():
+    """Build a mock HTTP response whose body (.content and .json()) is payload."""
+    def _make(payload):
+        resp = MagicMock(spec=requests.Response)
+        resp.content = to_json(payload)
+        resp.json.return_value = payload
+        resp.raise_for_status.return_value = None
+        return resp
+    return _make
+
+
+@pytest.fixture
+async def db_session():
+    """A database session whose writes are rolled back after the test.
+
+    Repository functions only flush, so everything a test writes stays in
+    this session's transaction and nothing is left behind in the database.
+    """
+    from db import AsyncSessionLocal  # requires DATABASE_URL; only DB tests use this
+
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
@@ -0,0 +1,51 @@
+"""Unit tests for batch_copywriter — Message Batches submit/poll/collect."""
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tools.batch_copywriter import BatchProcessor, build_request
+
+
+def _resp(payload=None, text=""):
+    resp = MagicMock()
+    resp.json.return_value = payload
+    resp.text = text
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def _result_line(custom_id, text=None, kind="succeeded"):
+    result = {"type": kind}
+    if text is not None:
+        result["message"] = {"content": [{"type": "text", "text": text}]}
+    return json.dumps({"custom_id": custom_id, "result": result})
+
+
+def test_build_request_marks_system_prompt_cacheable():
+    req = build_request("lead-001", "claude-sonnet-4-6", "SYSTEM", "USER")
+
+    assert req["custom_id"] == "lead-001"
+    assert req["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert req["params"]["messages"] == [{"role": "user", "content": "USER"}]
+
+
+async def test_run_polls_until_ended_and_returns_succeeded_texts():
+    client = MagicMock()
+    client.post = AsyncMock(return_value=_resp({"id": "b1", "processing_status": "in_progress"}))
+    client.get = AsyncMock(side_effect=[
+        _resp({"id": "b1", "processing_status": "in_progress", "request_counts": {"processing": 2}}),
+        _resp({"id": "b1", "processing_status": "ended", "request_counts": {"succeeded": 1, "errored": 1},
+               "results_url": "https://example.com/results"}),
+        _resp(text="\n".join([_result_line("lead-001", '{"lead_id": "lead-001"}'),
+                              _result_line("lead-002", kind="errored")])),
+    ])
+    client_cm = MagicMock()
+    client_cm.__aenter__ = AsyncMock(return_value=client)
+    client_cm.__aexit__ = AsyncMock(return_value=None)
+    progress = []
+
+    with patch("tools.batch_copywriter.httpx.AsyncClient", return_value=client_cm):
+        processor = BatchProcessor(api_key="test-key", poll_interval=0, on_progress=progress.append)
+        results = await processor.run([build_request("lead-001", "m", "s", "u")])
+
+    assert results == {"lead-001": '{"lead_id": "lead-001"}'}
+    assert progress == [{"processing": 2}, {"succeeded": 1, "errored": 1}]
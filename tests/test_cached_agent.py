@@ -0,0 +1,77 @@
+"""Unit tests for CachedOutputAgent — disk-cached sub-agent output."""
+import json
+from typing import Any, AsyncGenerator
+
+from google.adk.agents import BaseAgent, InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai.types import Content, Part
+
+from teams.cached_agent import CachedOutputAgent
+
+
+class _FixedOutputAgent(BaseAgent):
+    """Writes a fixed value to ``profile`` and counts its runs."""
+
+    output: Any
+    runs: int = 0
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        self.runs += 1
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={"profile": self.output}),
+        )
+
+
+async def _run(agent):
+    service = InMemorySessionService()
+    session = await service.create_session(app_name="test", user_id="u")
+    runner = Runner(agent=agent, app_name="test", session_service=service)
+    async for _ in runner.run_async(
+        user_id="u", session_id=session.id, new_message=Content(role="user", parts=[Part(text="go")]),
+    ):
+        pass
+    session = await service.get_session(app_name="test", user_id="u", session_id=session.id)
+    return session.state.get("profile")
+
+
+def _cached(tmp_path, output):
+    inner = _FixedOutputAgent(name="Profiler", output=output)
+    agent = CachedOutputAgent(
+        name="CachedProfiler",
+        sub_agents=[inner],
+        output_key="profile",
+        cache_path=tmp_path / "profile.json",
+        fingerprint="fp",
+    )
+    return agent, inner
+
+
+class TestCachedOutputAgent:
+    async def test_second_run_is_served_from_cache(self, tmp_path):
+        output = '```json\n{"summary": "ok"}\n```'
+        agent, inner = _cached(tmp_path, output)
+
+        await _run(agent)
+        assert await _run(agent) == output
+        assert inner.runs == 1
+
+    async def test_output_that_is_not_a_json_object_is_not_cached(self, tmp_path):
+        for output in ("I can't help with that.", '{"summary": ', "[1, 2]"):
+            agent, inner = _cached(tmp_path, output)
+
+            await _run(agent)
+            await _run(agent)
+
+            assert inner.runs == 2
+            assert not (tmp_path / "profile.json").exists()
+
+    async def test_non_object_cache_file_is_ignored(self, tmp_path):
+        (tmp_path / "profile.json").write_text(json.dumps(["fp"]))
+        agent, inner = _cached(tmp_path, '{"summary": "ok"}')
+
+        assert await _run(agent) == '{"summary": "ok"}'
+        assert inner.runs == 1
@@ -0,0 +1,105 @@
+"""Unit tests for calendar_tools — free-slot search against busy periods."""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tools import calendar_tools
+from tools.calendar_tools import create_event, get_event, get_free_slots
+
+CHICAGO = ZoneInfo("America/Chicago")
+
+
+@pytest.fixture(autouse=True)
+def _fast_google(monkeypatch):
+    """Never load credentials or build a real client: no discovery HTTP."""
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/tmp/creds.json")
+    monkeypatch.setattr(calendar_tools, "build", MagicMock(side_effect=lambda *a, **k: MagicMock()))
+    monkeypatch.setattr(
+        calendar_tools.service_account.Credentials, "from_service_account_file", MagicMock(),
+    )
+    monkeypatch.setattr(calendar_tools, "_local", calendar_tools.threading.local())
+    calendar_tools._credentials.cache_clear()
+    yield
+    calendar_tools._credentials.cache_clear()
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        # Monday 2026-03-02, 08:00 Chicago — before the first 9am slot.
+        return datetime(2026, 3, 2, 8, 0, tzinfo=CHICAGO).astimezone(tz)
+
+
+def _free_slots(busy):
+    service = MagicMock()
+    service.freebusy.return_value.query.return_value.execute.return_value = {
+        "calendars": {"cal": {"busy": busy}},
+    }
+    with patch("tools.calendar_tools.datetime", _FixedDatetime):
+        return get_free_slots(duration_minutes=30, days_ahead=7, calendar_id="cal", _service_obj=service)
+
+
+class TestGetFreeSlots:
+    def test_no_busy_periods_returns_first_three_slots(self):
+        result = _free_slots([])
+
+        assert [s["start_datetime"][11:16] for s in result["slots"]] == ["09:00", "10:00", "11:00"]
+
+    def test_skips_slots_overlapping_busy_periods(self):
+        # Unsorted and overlapping on purpose: 9:00–10:15 and 10:00–10:45 CT
+        # together block the 9am and 10am slots. 11:30 doesn't touch 11:00–11:30.
+        busy = [
+            {"start": "2026-03-02T16:00:00Z", "end": "2026-03-02T16:45:00Z"},
+            {"start": "2026-03-02T15:00:00Z", "end": "2026-03-02T16:15:00Z"},
+            {"start": "2026-03-02T17:30:00Z", "end": "2026-03-02T18:00:00Z"},
+        ]
+
+        result = _free_slots(busy)
+
+        assert [s["start_datetime"][11:16] for s in result["slots"]] == ["11:00", "14:00", "15:00"]
+
+    def test_api_error_returns_error_key(self):
+        with patch("tools.calendar_tools._service", side_effect=RuntimeError("no creds")):
+            result = get_free_slots(calendar_id="cal")
+
+        assert result["slots"] == []
+        assert "no creds" in result["error"]
+
+
+class TestEvents:
+    def test_create_event_returns_meet_link(self):
+        service = MagicMock()
+        service.events.return_value.insert.return_value.execute.return_value = {
+            "id": "evt-1",
+            "htmlLink": "https://calendar.google.com/evt-1",
+            "conferenceData": {"entryPoints": [{"uri": "https://meet.google.com/abc"}]},
+        }
+
+        result = create_event(
+            "Intro", "2026-03-02T11:00:00", "2026-03-02T11:30:00", "jane@example.com",
+            calendar_id="cal", _service_obj=service,
+        )
+
+        assert result["event_id"] == "evt-1"
+        assert result["meet_link"] == "https://meet.google.com/abc"
+        insert_kwargs = service.events.return_value.insert.call_args.kwargs
+        assert insert_kwargs["calendarId"] == "cal"
+        assert insert_kwargs["body"]["attendees"] == [{"email": "jane@example.com"}]
+
+    def test_get_event_error_returns_error_key(self):
+        service = MagicMock()
+        service.events.return_value.get.return_value.execute.side_effect = RuntimeError("not found")
+
+        result = get_event("evt-1", calendar_id="cal", _service_obj=service)
+
+        assert "not found" in result["error"]
+
+
+class TestService:
+    def test_client_is_built_once_per_thread(self):
+        first = calendar_tools._service()
+
+        assert calendar_tools._service() is first
+        assert calendar_tools.build.call_count == 1
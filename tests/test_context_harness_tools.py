@@ -1,16 +1,23 @@
 """Unit tests for context_harness_tools — no running server required."""
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import requests
 
-from tools.context_harness_tools import ctx_search
+from tools import context_harness_tools
+from tools.context_harness_tools import ctx_search, ctx_search_async
+
+
+@pytest.fixture(autouse=True)
+def _reset_breaker():
+    context_harness_tools._BREAKER.reset()
 
 
 def test_graceful_degradation_connection_error():
     """Should return empty results + error key when server is unreachable."""
     with patch(
-        "tools.context_harness_tools.requests.post",
+        "tools.context_harness_tools._SESSION.post",
         side_effect=requests.exceptions.ConnectionError("Connection refused"),
     ):
         result = ctx_search("personalization hooks that converted")
@@ -21,18 +28,16 @@ def test_graceful_degradation_connection_error():
     assert "unavailable" in result["error"]
 
 
-def test_parses_results_correctly():
+def test_parses_results_correctly(make_resp):
     """Should correctly return the results array from the server response."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response = make_resp({
         "results": [
             {"id": "doc-1", "content": "ICP profiler context for event organizers", "score": 0.92},
             {"id": "doc-2", "content": "Objection handling for pricing questions", "score": 0.78},
         ]
-    }
-    mock_response.raise_for_status.return_value = None
+    })
 
-    with patch("tools.context_harness_tools.requests.post", return_value=mock_response):
+    with patch("tools.context_harness_tools._SESSION.post", return_value=mock_response):
         result = ctx_search("ICP scoring event organizer", limit=3)
 
     assert len(result["results"]) == 2
@@ -44,7 +49,7 @@ def test_parses_results_correctly():
 def test_handles_generic_exception():
     """Should return error key for any unexpected exception."""
     with patch(
-        "tools.context_harness_tools.requests.post",
+        "tools.context_harness_tools._SESSION.post",
         side_effect=ValueError("unexpected error"),
     ):
         result = ctx_search("test query")
@@ -54,13 +59,11 @@ def test_handles_generic_exception():
     assert "unexpected error" in result["error"]
 
 
-def test_empty_results_from_server():
+def test_empty_results_from_server(make_resp):
     """Should handle a valid response with an empty results list."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": []}
-    mock_response.raise_for_status.return_value = None
+    mock_response = make_resp({"results": []})
 
-    with patch("tools.context_harness_tools.requests.post", return_value=mock_response):
+    with patch("tools.context_harness_tools._SESSION.post", return_value=mock_response):
         result = ctx_search("email history Acme Corp")
 
     assert result["results"] == []
@@ -80,8 +83,102 @@ def test_uses_env_vars_for_url_and_timeout(monkeypatch):
         captured["timeout"] = timeout
         raise requests.exceptions.ConnectionError("test")
 
-    with patch("tools.context_harness_tools.requests.post", side_effect=fake_post):
+    with patch("tools.context_harness_tools._SESSION.post", side_effect=fake_post):
         ctx_search("test")
 
     assert captured["url"] == "http://custom-host:9000/tools/search"
     assert captured["timeout"] == 10
+
+
+async def test_async_parses_results(make_resp):
+    """ctx_search_async should return the results array from the server."""
+    mock_response = make_resp({"results": [{"id": "doc-1", "content": "hook"}]})
+    client = MagicMock()
+    client.post = AsyncMock(return_value=mock_response)
+
+    with patch("tools.context_harness_tools._async_client", return_value=client):
+        result = await ctx_search_async("hooks", limit=3)
+
+    client.post.assert_awaited_once()
+    assert client.post.call_args.kwargs["json"] == {"query": "hooks", "limit": 3}
+    assert result == {"results": [{"id": "doc-1", "content": "hook"}], "query": "hooks"}
+
+
+async def test_async_graceful_degradation_connection_error():
+    """ctx_search_async should fail open when the server is unreachable."""
+    client = MagicMock()
+    client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+
+    with patch("tools.context_harness_tools._async_client", return_value=client):
+        result = await ctx_search_async("personalization hooks")
+
+    assert result["results"] == []
+    assert "unavailable" in result["error"]
+
+
+async def test_async_uses_env_vars_for_url_and_timeout(monkeypatch):
+    """ctx_search_async should read CTX_MCP_URL / CTX_SEARCH_TIMEOUT per call."""
+    monkeypatch.setenv("CTX_MCP_URL", "http://custom-host:9000")
+    monkeypatch.setenv("CTX_SEARCH_TIMEOUT", "10")
+    client = MagicMock()
+    client.post = AsyncMock(side_effect=httpx.ConnectError("test"))
+
+    with patch("tools.context_harness_tools._async_client", return_value=client):
+        await ctx_search_async("test")
+
+    assert client.post.call_args.args[0] == "http://custom-host:9000/tools/search"
+    assert client.post.call_args.kwargs["timeout"] == 10
+
+
+def test_breaker_skips_calls_after_repeated_connection_errors():
+    """After three connection failures, searches return at once without a request."""
+    with patch(
+        "tools.context_harness_tools._SESSION.post",
+        side_effect=requests.exceptions.ConnectionError("Connection refused"),
+    ) as mock_post:
+        for _ in range(4):
+            result = ctx_search("hooks")
+
+    assert mock_post.call_count == 3
+    assert "breaker open" in result["error"]
+
+
+def test_success_resets_breaker_failure_count(make_resp):
+    refused = requests.exceptions.ConnectionError("Connection refused")
+    with patch(
+        "tools.context_harness_tools._SESSION.post",
+        side_effect=[refused, refused, make_resp({"results": []}), refused, refused],
+    ) as mock_post:
+        for _ in range(5):
+            ctx_search("hooks")
+
+    assert mock_post.call_count == 5
+    assert not context_harness_tools._BREAKER.is_open()
+
+
+def test_breaker_opens_after_repeated_server_errors(make_resp):
+    """A 503 is an outage too — it must not reset the failure count."""
+    unavailable = make_resp({})
+    unavailable.raise_for_status.side_effect = requests.HTTPError(
+        "503 Service Unavailable", response=MagicMock(status_code=503),
+    )
+    with patch("tools.context_harness_tools._SESSION.post", return_value=unavailable) as mock_post:
+        for _ in range(4):
+            result = ctx_search("hooks")
+
+    assert mock_post.call_count == 3
+    assert result["results"] == []
+    assert "breaker open" in result["error"]
+
+
+async def test_async_breaker_opens_after_repeated_server_errors():
+    request = httpx.Request("POST", "http://127.0.0.1:7331/tools/search")
+    client = MagicMock()
+    client.post = AsyncMock(return_value=httpx.Response(503, request=request))
+
+    with patch("tools.context_harness_tools._async_client", return_value=client):
+        for _ in range(4):
+            result = await ctx_search_async("hooks")
+
+    assert client.post.await_count == 3
+    assert "breaker open" in result["error"]
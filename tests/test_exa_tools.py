@@ -1,5 +1,7 @@
 """Unit tests for exa_tools — verifies migration to search() with highlights."""
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -27,7 +29,7 @@ class TestExaSearchCompanies:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_search_companies
-        exa_search_companies("B2B event organizers")
+        exa_search_companies("B2B event organizers", _bypass_cache=True)
 
         client.search.assert_called_once()
         client.search_and_contents.assert_not_called()
@@ -40,7 +42,7 @@ class TestExaSearchCompanies:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_search_companies
-        exa_search_companies("event organizers", num_results=5)
+        exa_search_companies("event organizers", num_results=5, _bypass_cache=True)
 
         call_kwargs = client.search.call_args
         assert "contents" in call_kwargs.kwargs
@@ -56,7 +58,7 @@ class TestExaSearchCompanies:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_search_companies
-        exa_search_companies("test query")
+        exa_search_companies("test query", _bypass_cache=True)
 
         call_kwargs = client.search.call_args
         assert call_kwargs.kwargs.get("type") == "auto"
@@ -71,7 +73,7 @@ class TestExaSearchCompanies:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_search_companies
-        result = exa_search_companies("test")
+        result = exa_search_companies("test", _bypass_cache=True)
 
         assert len(result["results"]) == 1
         assert "highlights" in result["results"][0]
@@ -85,7 +87,7 @@ class TestExaSearchCompanies:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_search_companies
-        result = exa_search_companies("test")
+        result = exa_search_companies("test", _bypass_cache=True)
 
         assert result["results"] == []
         assert "error" in result
@@ -100,7 +102,7 @@ class TestExaFindContact:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_find_contact
-        exa_find_contact("Acme Corp", "acme.com")
+        exa_find_contact("Acme Corp", "acme.com", _bypass_cache=True)
 
         for call in client.search.call_args_list:
             assert call.kwargs.get("category") == "people"
@@ -115,8 +117,157 @@ class TestExaFindContact:
         mock_client_fn.return_value = client
 
         from tools.exa_tools import exa_find_contact
-        result = exa_find_contact("Acme Corp", "acme.com")
+        result = exa_find_contact("Acme Corp", "acme.com", _bypass_cache=True)
 
         assert len(result["results"]) > 0
         assert "highlights" in result["results"][0]
         assert "text" not in result["results"][0]
+
+
+    @patch("tools.exa_tools._client")
+    def test_failed_query_keeps_other_results_in_order(self, mock_client_fn):
+        """Sub-queries run concurrently; results keep query order and one failure is skipped."""
+        def search(q, **kwargs):
+            if q.startswith("site:"):
+                raise RuntimeError("rate limited")
+            return _make_mock_response([_make_mock_result(title=q)])
+
+        client = MagicMock()
+        client.search.side_effect = search
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_find_contact
+        result = exa_find_contact("Acme Corp", "acme.com", _bypass_cache=True)
+
+        assert client.search.call_count == 3
+        assert [r["title"] for r in result["results"]] == [
+            "Acme Corp VP Marketing director email",
+            "Acme Corp executive director membership",
+        ]
+
+
+    @patch("tools.exa_tools._client")
+    def test_sub_queries_run_concurrently(self, mock_client_fn):
+        """All three searches must be in flight at once to pass the barrier."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(q, **kwargs):
+            barrier.wait()
+            return _make_mock_response()
+
+        client = MagicMock()
+        client.search.side_effect = search
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_find_contact
+        result = exa_find_contact("Acme Corp", "acme.com", _bypass_cache=True)
+
+        assert len(result["results"]) == 3
+
+
+class TestExaCache:
+    @patch("tools.exa_tools._client")
+    def test_second_identical_search_is_served_from_disk(self, mock_client_fn, tmp_path, monkeypatch):
+        """Same normalized query + options should only hit Exa once."""
+        monkeypatch.setenv("TOOL_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+        client.search.return_value = _make_mock_response()
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_search_companies
+        first = exa_search_companies("B2B  Event Organizers")
+        second = exa_search_companies("b2b event organizers")
+
+        client.search.assert_called_once()
+        assert second == first
+
+    @patch("tools.exa_tools._client")
+    def test_errors_are_not_cached(self, mock_client_fn, tmp_path, monkeypatch):
+        monkeypatch.setenv("TOOL_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+        client.search.side_effect = [RuntimeError("API down"), _make_mock_response()]
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_search_companies
+        assert "error" in exa_search_companies("test")
+        assert "error" not in exa_search_companies("test")
+        assert client.search.call_count == 2
+
+    @pytest.mark.parametrize("name", [
+        "exa_search_companies", "exa_find_contact",
+        "exa_search_companies_async", "exa_find_contact_async",
+    ])
+    def test_bypass_flag_is_not_in_tool_schema(self, name):
+        """The model shouldn't be able to skip the cache."""
+        from google.adk.tools import FunctionTool
+
+        from tools import exa_tools
+        declaration = FunctionTool(getattr(exa_tools, name))._get_declaration()
+        schema = declaration.parameters_json_schema or declaration.parameters.model_dump()
+        assert "bypass" not in str(schema)
+        assert "bypass" not in declaration.description
+
+
+class TestExaAsync:
+    @patch("tools.exa_tools._async_client")
+    async def test_search_companies_async_uses_highlights(self, mock_client_fn):
+        """Async variant should await AsyncExa.search with the same options."""
+        client = MagicMock()
+        client.search = AsyncMock(return_value=_make_mock_response())
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_search_companies_async
+        result = await exa_search_companies_async("event organizers", num_results=5, _bypass_cache=True)
+
+        client.search.assert_awaited_once()
+        assert client.search.call_args.kwargs["contents"]["highlights"]["maxCharacters"] == 4000
+        assert result["results"][0]["highlights"] == ["relevant excerpt"]
+
+    @patch("tools.exa_tools._async_client")
+    async def test_find_contact_async_runs_all_queries(self, mock_client_fn):
+        """All three contact queries should run; one failing is skipped."""
+        client = MagicMock()
+        client.search = AsyncMock(side_effect=[
+            _make_mock_response(),
+            RuntimeError("API down"),
+            _make_mock_response(),
+        ])
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_find_contact_async
+        result = await exa_find_contact_async("Acme Corp", "acme.com", _bypass_cache=True)
+
+        assert client.search.await_count == 3
+        assert len(result["results"]) == 2
+        for call in client.search.call_args_list:
+            assert call.kwargs.get("category") == "people"
+
+    @patch("tools.exa_tools._async_client")
+    async def test_concurrent_identical_searches_share_one_call(self, mock_client_fn):
+        """Same query in flight twice (modulo case/whitespace) → one Exa call."""
+        client = MagicMock()
+        client.search = AsyncMock(return_value=_make_mock_response())
+        mock_client_fn.return_value = client
+
+        from tools.exa_tools import exa_search_companies_async
+        first, second, other = await asyncio.gather(
+            exa_search_companies_async("Event Organizers", _bypass_cache=True),
+            exa_search_companies_async("event  organizers", _bypass_cache=True),
+            exa_search_companies_async("associations", _bypass_cache=True),
+        )
+
+        assert client.search.await_count == 2
+        assert first == second
+        assert "error" not in other
+
+
+class TestExaClients:
+    def test_async_client_is_reused_per_key(self, monkeypatch):
+        from tools.exa_tools import _async_client
+
+        monkeypatch.setenv("EXA_API_KEY", "key-a")
+        first = _async_client()
+        assert _async_client() is first
+
+        monkeypatch.setenv("EXA_API_KEY", "key-b")
+        assert _async_client() is not first
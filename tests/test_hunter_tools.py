@@ -1,22 +1,50 @@
 """Unit tests for hunter_tools — campaign/sending functions."""
-from unittest.mock import MagicMock, patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
+import requests
+
+from tools import hunter_tools
+from tools.hunter_tools import (
+    hunter_add_recipient,
+    hunter_create_lead,
+    hunter_create_leads_batch,
+    hunter_find_and_verify,
+    hunter_find_email,
+    hunter_list_campaigns,
+    hunter_start_campaign,
+    hunter_verify_email,
+    hunter_verify_emails_batch,
+)
 
 HUNTER_MODULE = "tools.hunter_tools"
 
 
+@pytest.fixture(autouse=True, scope="class")
+def _patch_api_key():
+    with patch(f"{HUNTER_MODULE}._api_key", return_value="test-key"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    hunter_tools._DOMAIN_CACHE.clear()
+    hunter_tools._CAMPAIGNS_CACHE.clear()
+    hunter_tools._VERIFY_CACHE.clear()
+    hunter_tools._VERIFY_MISS_CACHE.clear()
+    hunter_tools._FIND_CACHE.clear()
+    hunter_tools._FIND_MISS_CACHE.clear()
+    hunter_tools._BREAKER.reset()
+
+
 class TestHunterCreateLead:
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_creates_lead_successfully(self, mock_key, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"data": {"id": 42}}
-        mock_resp.raise_for_status.return_value = None
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_creates_lead_successfully(self, mock_post, make_resp):
+        mock_resp = make_resp({"data": {"id": 42}})
         mock_post.return_value = mock_resp
 
-        from tools.hunter_tools import hunter_create_lead
         result = hunter_create_lead(
             email="jane@acme.com",
             first_name="Jane",
@@ -30,12 +58,10 @@ class TestHunterCreateLead:
         call_kwargs = mock_post.call_args
         assert call_kwargs.kwargs["json"]["email"] == "jane@acme.com"
 
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_handles_error_gracefully(self, mock_key, mock_post):
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_handles_error_gracefully(self, mock_post):
         mock_post.side_effect = RuntimeError("network error")
 
-        from tools.hunter_tools import hunter_create_lead
         result = hunter_create_lead(email="jane@acme.com")
 
         assert result["lead_id"] is None
@@ -43,69 +69,40 @@ class TestHunterCreateLead:
 
 
 class TestHunterAddRecipient:
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_adds_recipients_successfully(self, mock_key, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "data": {
-                "recipients_added": 2,
-                "skipped_recipients": [],
-            }
-        }
-        mock_resp.raise_for_status.return_value = None
-        mock_post.return_value = mock_resp
+    @pytest.mark.parametrize("data,added,skipped_reasons", [
+        ({"recipients_added": 2, "skipped_recipients": []}, 2, []),
+        ({"recipients_added": 1, "skipped_recipients": [{"email": "b@test.com", "reason": "duplicate"}]},
+         1, ["duplicate"]),
+    ], ids=["all_added", "one_skipped"])
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_adds_recipients(self, mock_post, data, added, skipped_reasons, make_resp):
+        mock_post.return_value = make_resp({"data": data})
 
-        from tools.hunter_tools import hunter_add_recipient
         result = hunter_add_recipient(campaign_id=123, emails=["a@test.com", "b@test.com"])
 
         assert result["campaign_id"] == 123
-        assert result["recipients_added"] == 2
-        assert len(result["skipped_recipients"]) == 0
-
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_caps_at_50_emails(self, mock_key, mock_post):
-        """Hunter API limit: 50 emails per call."""
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"data": {"recipients": [], "skipped_recipients": []}}
-        mock_resp.raise_for_status.return_value = None
-        mock_post.return_value = mock_resp
-
-        from tools.hunter_tools import hunter_add_recipient
-        emails = [f"user{i}@test.com" for i in range(60)]
-        hunter_add_recipient(campaign_id=1, emails=emails)
-
-        sent_emails = mock_post.call_args.kwargs["json"]["emails"]
-        assert len(sent_emails) == 50
+        assert result["recipients_added"] == added
+        assert [s["reason"] for s in result["skipped_recipients"]] == skipped_reasons
 
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_reports_skipped_recipients(self, mock_key, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "data": {
-                "recipients_added": 1,
-                "skipped_recipients": [
-                    {"email": "b@test.com", "reason": "duplicate"},
-                ],
-            }
-        }
-        mock_resp.raise_for_status.return_value = None
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_chunks_at_50_emails(self, mock_post, make_resp):
+        """Hunter API limit: 50 emails per call — longer lists go in chunks."""
+        mock_resp = make_resp({"data": {"recipients_added": 5, "skipped_recipients": []}})
         mock_post.return_value = mock_resp
 
-        from tools.hunter_tools import hunter_add_recipient
-        result = hunter_add_recipient(campaign_id=1, emails=["a@test.com", "b@test.com"])
+        emails = [f"user{i}@test.com" for i in range(60)]
+        lead_ids = list(range(60))
+        result = hunter_add_recipient(campaign_id=1, emails=emails, lead_ids=lead_ids)
 
-        assert len(result["skipped_recipients"]) == 1
-        assert result["skipped_recipients"][0]["reason"] == "duplicate"
+        payloads = [call.kwargs["json"] for call in mock_post.call_args_list]
+        assert [len(p["emails"]) for p in payloads] == [50, 10]
+        assert payloads[1]["lead_ids"] == lead_ids[50:]
+        assert result["recipients_added"] == 10
 
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_handles_error_gracefully(self, mock_key, mock_post):
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_handles_error_gracefully(self, mock_post):
         mock_post.side_effect = RuntimeError("network error")
 
-        from tools.hunter_tools import hunter_add_recipient
         result = hunter_add_recipient(campaign_id=1, emails=["a@test.com"])
 
         assert result["recipients_added"] == 0
@@ -113,55 +110,261 @@ class TestHunterAddRecipient:
 
 
 class TestHunterListCampaigns:
-    @patch(f"{HUNTER_MODULE}.requests.get")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_lists_campaigns(self, mock_key, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_lists_campaigns(self, mock_get, make_resp):
+        mock_resp = make_resp({
             "data": {
                 "campaigns": [
                     {"id": 1, "name": "Q1 Outreach", "started": True},
                     {"id": 2, "name": "Q2 Outreach", "started": False},
                 ]
             }
-        }
-        mock_resp.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_resp
 
-        from tools.hunter_tools import hunter_list_campaigns
         result = hunter_list_campaigns()
 
         assert len(result["campaigns"]) == 2
 
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_cached_until_campaign_starts(self, mock_get, mock_post, make_resp):
+        mock_resp = make_resp({"data": {"campaigns": [{"id": 1, "started": False}]}})
+        mock_get.return_value = mock_resp
+        mock_post.return_value = mock_resp
+
+        hunter_list_campaigns()
+        hunter_list_campaigns()
+        assert mock_get.call_count == 1
+
+        hunter_start_campaign(1)
+        hunter_list_campaigns()
+        assert mock_get.call_count == 2
+
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_errors_are_not_cached(self, mock_get):
+        mock_get.side_effect = RuntimeError("network error")
+
+        assert "error" in hunter_list_campaigns()
+        assert "error" in hunter_list_campaigns()
+        assert mock_get.call_count == 2
+
 
 class TestHunterStartCampaign:
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_starts_campaign(self, mock_key, mock_post):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_starts_campaign(self, mock_post, make_resp):
+        mock_resp = make_resp({
             "data": {
                 "message": "42 emails scheduled for sending.",
                 "recipients_count": 21,
             }
-        }
-        mock_resp.raise_for_status.return_value = None
+        })
         mock_post.return_value = mock_resp
 
-        from tools.hunter_tools import hunter_start_campaign
         result = hunter_start_campaign(campaign_id=42)
 
         assert result["started"] is True
         assert result["campaign_id"] == 42
         assert result["recipients_count"] == 21
 
-    @patch(f"{HUNTER_MODULE}.requests.post")
-    @patch(f"{HUNTER_MODULE}._api_key", return_value="test-key")
-    def test_handles_error(self, mock_key, mock_post):
+    @patch(f"{HUNTER_MODULE}._SESSION.post")
+    def test_handles_error(self, mock_post):
         mock_post.side_effect = RuntimeError("forbidden")
 
-        from tools.hunter_tools import hunter_start_campaign
         result = hunter_start_campaign(campaign_id=42)
 
         assert result["started"] is False
         assert "error" in result
+
+
+class TestHunterVerifyEmail:
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_repeat_verification_is_served_from_cache(self, mock_get, make_resp):
+        mock_get.return_value = make_resp({"data": {"status": "valid", "score": 95}})
+
+        first = hunter_verify_email("jane@acme.com")
+        second = hunter_verify_email(" Jane@Acme.com")
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"] == {"email": "jane@acme.com", "api_key": "test-key"}
+        assert second["status"] == first["status"] == "valid"
+        assert second["email"] == " Jane@Acme.com"
+
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_failed_verification_is_not_cached(self, mock_get, make_resp):
+        mock_get.side_effect = [RuntimeError("timeout"), make_resp({"data": {"status": "valid"}})]
+
+        assert "error" in hunter_verify_email("jane@acme.com")
+        assert hunter_verify_email("jane@acme.com")["status"] == "valid"
+
+    @pytest.mark.parametrize("status,cache_name,ttl", [
+        ("valid", "_VERIFY_CACHE", 86400),
+        ("accept_all", "_VERIFY_CACHE", 86400),
+        ("unknown", "_VERIFY_MISS_CACHE", 3600),
+        ("invalid", "_VERIFY_MISS_CACHE", 3600),
+    ])
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_verdict_cache_ttl_depends_on_status(self, mock_get, make_resp, status, cache_name, ttl):
+        """Transient-looking verdicts are re-checked after an hour, the rest after a day."""
+        mock_get.return_value = make_resp({"data": {"status": status}})
+
+        hunter_verify_email("jane@acme.com")
+        hunter_verify_email("jane@acme.com")
+
+        assert mock_get.call_count == 1
+        cache = getattr(hunter_tools, cache_name)
+        assert cache.ttl == ttl
+        assert cache.get("jane@acme.com")["status"] == status
+
+
+class TestHunterFindEmail:
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_not_found_is_remembered(self, mock_get):
+        not_found = requests.HTTPError("404 Not Found", response=MagicMock(status_code=404))
+        mock_get.return_value.raise_for_status.side_effect = not_found
+
+        first = hunter_find_email("acme.com", "Jane", "Doe")
+        second = hunter_find_email("ACME.com", "jane", "doe")
+
+        assert mock_get.call_count == 1
+        assert first["email"] == second["email"] == ""
+        assert "404" in second["error"]
+
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_other_errors_are_retried(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("reset")
+
+        hunter_find_email("acme.com", "Jane", "Doe")
+        hunter_find_email("acme.com", "Jane", "Doe")
+
+        assert mock_get.call_count == 2
+
+
+class TestHunterCircuitBreaker:
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_outage_opens_breaker(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("reset")
+
+        for i in range(6):
+            result = hunter_verify_email(f"user{i}@acme.com")
+
+        assert mock_get.call_count == 5
+        assert "breaker open" in result["error"]
+
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_client_errors_do_not_count(self, mock_get):
+        not_found = requests.HTTPError("404 Not Found", response=MagicMock(status_code=404))
+        mock_get.return_value.raise_for_status.side_effect = not_found
+
+        for i in range(6):
+            hunter_find_email("acme.com", f"user{i}", "doe")
+
+        assert mock_get.call_count == 6
+
+    def test_exhausted_status_retries_open_breaker(self, monkeypatch):
+        """Real 503s through the session's retrying adapter count as an outage."""
+        hits = []
+
+        class Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Unavailable)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        # Same adapter and retry policy as in production, minus the backoff sleeps.
+        adapter = hunter_tools._SESSION.get_adapter(hunter_tools.HUNTER_BASE)
+        monkeypatch.setattr(adapter, "max_retries", adapter.max_retries.new(backoff_factor=0))
+        monkeypatch.setitem(hunter_tools._SESSION.adapters, "http://", adapter)
+        monkeypatch.setattr(hunter_tools, "HUNTER_BASE", f"http://127.0.0.1:{server.server_port}/v2")
+        try:
+            for i in range(6):
+                result = hunter_verify_email(f"user{i}@acme.com")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(hits) == 5 * 4  # five calls, each with three retries
+        assert "breaker open" in result["error"]
+
+
+class TestHunterAsync:
+    @patch(f"{HUNTER_MODULE}._async_client")
+    async def test_unknown_verdict_is_kept_for_an_hour_only(self, mock_client_fn, make_resp):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=make_resp({"data": {"status": "unknown"}}))
+        mock_client_fn.return_value = client
+
+        from tools.hunter_tools import hunter_verify_email_async
+        await hunter_verify_email_async("jane@acme.com")
+        await hunter_verify_email_async("jane@acme.com")
+
+        assert client.get.await_count == 1
+        assert hunter_tools._VERIFY_CACHE.get("jane@acme.com") is None
+        assert hunter_tools._VERIFY_MISS_CACHE.get("jane@acme.com")["status"] == "unknown"
+
+    @patch(f"{HUNTER_MODULE}._async_client")
+    async def test_verify_emails_batch_keeps_order(self, mock_client_fn, make_resp):
+        """Each address is verified; one failure doesn't sink the batch."""
+        ok = make_resp({"data": {"status": "valid", "score": 95}})
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=[ok, RuntimeError("timeout")])
+        mock_client_fn.return_value = client
+
+        result = await hunter_verify_emails_batch(["a@test.com", "b@test.com"])
+
+        assert [r["email"] for r in result["results"]] == ["a@test.com", "b@test.com"]
+        assert result["results"][0]["verified"] is True
+        assert "error" in result["results"][1]
+        assert client.get.call_args.kwargs["headers"] == {"X-API-KEY": "test-key"}
+
+    @patch(f"{HUNTER_MODULE}._async_client")
+    async def test_duplicate_emails_share_one_request(self, mock_client_fn, make_resp):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=make_resp({"data": {"status": "valid", "score": 95}}))
+        mock_client_fn.return_value = client
+
+        result = await hunter_verify_emails_batch(["a@test.com", "A@test.com", "b@test.com"])
+
+        assert [r["status"] for r in result["results"]] == ["valid"] * 3
+        assert result["results"][1]["email"] == "A@test.com"
+        assert client.get.await_count == 2
+
+    @patch(f"{HUNTER_MODULE}._async_client")
+    async def test_create_leads_batch_keeps_order(self, mock_client_fn, make_resp):
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=[make_resp({"data": {"id": 7}}), RuntimeError("timeout")])
+        mock_client_fn.return_value = client
+
+        result = await hunter_create_leads_batch([
+            {"email": "a@test.com", "company": "Acme"},
+            {"email": "b@test.com"},
+        ])
+
+        assert [r["lead_id"] for r in result["results"]] == [7, None]
+        assert "error" in result["results"][1]
+        assert client.post.call_args_list[0].kwargs["json"]["company"] == "Acme"
+
+
+class TestHunterFindAndVerify:
+    @pytest.mark.parametrize("score,verifier_calls,verified_by", [
+        (95, 0, "score"),
+        (80, 1, "verifier"),
+        (40, 0, None),
+    ])
+    @patch(f"{HUNTER_MODULE}._SESSION.get")
+    def test_verifier_only_for_borderline_scores(self, mock_get, score, verifier_calls, verified_by, make_resp):
+        finder = make_resp({"data": {"email": "jane@acme.com", "score": score}})
+        verifier = make_resp({"data": {"status": "valid", "score": 92}})
+        mock_get.side_effect = [finder, verifier]
+
+        result = hunter_find_and_verify("acme.com", "Jane", "Doe")
+
+        assert mock_get.call_count == 1 + verifier_calls
+        assert result["verified_by"] == verified_by
+        assert result["verified"] is (verified_by is not None)
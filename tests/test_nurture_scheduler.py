@@ -0,0 +1,27 @@
+"""Unit tests for nurture_scheduler — re-contact dates without an LLM."""
+from datetime import date
+
+import pytest
+
+from tools.nurture_scheduler import compute_recontact_date
+
+TODAY = date(2026, 3, 10)
+
+
+class TestComputeRecontactDate:
+    @pytest.mark.parametrize("reply,expected", [
+        ("Try me in Q3.", date(2026, 7, 8)),                     # start of Q3 + 1 week
+        ("Reach out after our May conference.", date(2026, 6, 7)),  # end of May + 1 week
+        ("We're mid-campaign until May.", date(2026, 6, 7)),
+        ("Maybe in January?", date(2027, 1, 8)),                  # already past → next year
+        ("Check back in 6 weeks.", date(2026, 4, 21)),            # relative: no extra week
+    ])
+    def test_timing_cues(self, reply, expected):
+        assert compute_recontact_date(reply, today=TODAY) == expected
+
+    @pytest.mark.parametrize("reply", [
+        "Not right now, maybe later.",
+        "We may be open to this down the road.",  # "may" the verb, not the month
+    ])
+    def test_defaults_to_30_days_without_cue(self, reply):
+        assert compute_recontact_date(reply, today=TODAY) == date(2026, 4, 9)
@@ -0,0 +1,95 @@
+"""Unit tests for perplexity_tools — one multi-query call, Exa fallback."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class TestPplxSearchMulti:
+    @patch.dict("os.environ", {"PERPLEXITY_API_KEY": "test-key"})
+    @patch("tools.perplexity_tools._SESSION.post")
+    def test_single_request_for_all_queries(self, mock_post, make_resp):
+        """All queries should go out in one POST, results grouped per query."""
+        mock_post.return_value = make_resp({"results": [
+            [{"url": "https://a.com", "title": "A", "snippet": "about a"}],
+            [{"url": "https://b.com", "title": "B", "snippet": "about b"}],
+        ]})
+
+        from tools.perplexity_tools import pplx_search_multi
+        result = pplx_search_multi(["q1", "q2"])
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["json"] == {"query": ["q1", "q2"], "max_results": 5}
+        assert result["source"] == "perplexity"
+        assert [r["query"] for r in result["results"]] == ["q1", "q2"]
+        assert result["results"][1]["results"][0]["highlights"] == ["about b"]
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("tools.perplexity_tools.exa_search_companies")
+    def test_falls_back_to_exa_without_key(self, mock_exa):
+        """Without PERPLEXITY_API_KEY, each query should go to Exa."""
+        mock_exa.return_value = {"results": [{"url": "https://x.com"}], "query": "q"}
+
+        from tools.perplexity_tools import pplx_search_multi
+        result = pplx_search_multi(["q1", "q2", "q3"])
+
+        assert mock_exa.call_count == 3
+        assert result["source"] == "exa"
+        assert len(result["results"]) == 3
+
+    @patch.dict("os.environ", {"PERPLEXITY_API_KEY": "test-key"})
+    @patch("tools.perplexity_tools._SESSION.post")
+    def test_graceful_error_handling(self, mock_post):
+        """Should return error dict on exception, not raise."""
+        mock_post.side_effect = RuntimeError("API down")
+
+        from tools.perplexity_tools import pplx_search_multi
+        result = pplx_search_multi(["q1"])
+
+        assert "error" in result
+        assert result["results"] == [{"query": "q1", "results": []}]
+
+
+class TestPplxSearchMultiAsync:
+    @patch.dict("os.environ", {"PERPLEXITY_API_KEY": "test-key"})
+    async def test_single_request_for_all_queries(self, make_resp):
+        client = MagicMock()
+        client.post = AsyncMock(return_value=make_resp({"results": [
+            [{"url": "https://a.com", "title": "A", "snippet": "about a"}],
+            [{"url": "https://b.com", "title": "B"}],
+        ]}))
+
+        from tools.perplexity_tools import pplx_search_multi_async
+        with patch("tools.perplexity_tools._async_client", return_value=client):
+            result = await pplx_search_multi_async(["q1", "q2"])
+
+        client.post.assert_awaited_once()
+        assert client.post.call_args.kwargs["json"] == {"query": ["q1", "q2"], "max_results": 5}
+        assert result["source"] == "perplexity"
+        assert result["results"][0]["results"][0]["highlights"] == ["about a"]
+        assert result["results"][1]["results"][0]["highlights"] == []
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("tools.perplexity_tools.exa_search_companies_async", new_callable=AsyncMock)
+    async def test_falls_back_to_exa_without_key(self, mock_exa):
+        """Without PERPLEXITY_API_KEY, every query should go to async Exa."""
+        mock_exa.side_effect = lambda q, num_results: {"results": [{"url": f"https://{q}.com"}]}
+
+        from tools.perplexity_tools import pplx_search_multi_async
+        result = await pplx_search_multi_async(["q1", "q2", "q3"])
+
+        assert mock_exa.await_count == 3
+        assert result["source"] == "exa"
+        assert [r["results"][0]["url"] for r in result["results"]] == [
+            "https://q1.com", "https://q2.com", "https://q3.com",
+        ]
+
+    @patch.dict("os.environ", {"PERPLEXITY_API_KEY": "test-key"})
+    async def test_graceful_error_handling(self):
+        """Should return error dict on exception, not raise."""
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=RuntimeError("API down"))
+
+        from tools.perplexity_tools import pplx_search_multi_async
+        with patch("tools.perplexity_tools._async_client", return_value=client):
+            result = await pplx_search_multi_async(["q1"])
+
+        assert result["error"] == "API down"
+        assert result["results"] == [{"query": "q1", "results": []}]
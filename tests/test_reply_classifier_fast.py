@@ -0,0 +1,56 @@
+"""Unit tests for reply_classifier_fast — keyword fast path before the LLM."""
+import pytest
+
+from tools.reply_classifier_fast import classify_fast
+
+
+class TestClassifyFast:
+    @pytest.mark.parametrize("reply,expected", [
+        ("Sure, happy to chat!", "INTERESTED"),
+        ("We're mid-campaign — try me in Q3.", "NURTURE"),
+        ("Wrong person, sorry.", "NOT_FIT"),
+        ("Please unsubscribe me.", "UNSUBSCRIBE"),
+        ("Let’s find a time next week", "INTERESTED"),
+    ])
+    def test_unambiguous_replies(self, reply, expected):
+        result = classify_fast(reply)
+        assert result["classification"] == expected
+        assert result["key_phrase"].lower() in reply.lower().replace("’", "'")
+
+    def test_unsubscribe_wins_over_other_categories(self):
+        """Opt-outs are honored even when other phrases also match."""
+        result = classify_fast("Sounds good, but please take me off this list.")
+        assert result["classification"] == "UNSUBSCRIBE"
+
+    @pytest.mark.parametrize("reply", [
+        "Sounds good, but not right now.",      # two categories
+        "I'm not sure this is for us.",         # negated trigger
+        "Can you send pricing details?",        # no trigger at all
+    ])
+    def test_ambiguous_replies_defer_to_llm(self, reply):
+        assert classify_fast(reply) is None
+
+    @pytest.mark.parametrize("reply", [
+        "I am sure you are busy, but we already have an agency.",
+        "Yes, we already have an agency handling this.",
+    ])
+    def test_bare_affirmative_in_a_sentence_defers_to_llm(self, reply):
+        assert classify_fast(reply) is None
+
+    @pytest.mark.parametrize("reply", ["Yes!", "Sure thing, thanks."])
+    def test_standalone_affirmative_is_interested(self, reply):
+        assert classify_fast(reply)["classification"] == "INTERESTED"
+
+    def test_quoted_footer_does_not_unsubscribe(self):
+        """The footer of our own email, quoted back, is not an opt-out."""
+        reply = (
+            "Sounds good, Thursday works.\n\n"
+            "On Mon, Jun 3, 2024 at 9:12 AM Backflip Media <hello@backflip.media> wrote:\n"
+            "> Hi Dana, quick idea for your next event.\n"
+            "> To unsubscribe from these emails, reply with 'unsubscribe'.\n"
+        )
+        assert classify_fast(reply)["classification"] == "INTERESTED"
+
+    def test_unquoted_footer_is_ignored(self):
+        reply = "Tell me more.\nTo unsubscribe from these emails, reply with 'unsubscribe'."
+        assert classify_fast(reply)["classification"] == "INTERESTED"
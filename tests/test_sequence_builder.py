@@ -0,0 +1,69 @@
+"""Unit tests for SequenceBuilderAgent — campaign assembly without an LLM."""
+import json
+
+from google.adk.agents import SequentialAgent
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai.types import Content, Part
+
+from teams.outreach_strategy import SequenceBuilderAgent
+
+
+def _sequence(lead_id, **touch_overrides):
+    return {
+        "lead_id": lead_id,
+        "lead_name": f"Org {lead_id}",
+        "contacts": ["jane@example.com"],
+        "emails": [
+            {"touch_number": n, "send_day": day, "subject": f"Subject {n}", "body": "Hi Jane", **touch_overrides}
+            for n, day in ((1, 1), (2, 5), (3, 10))
+        ],
+    }
+
+
+async def _build(email_sequences):
+    agent = SequentialAgent(name="Team", sub_agents=[SequenceBuilderAgent(name="SequenceBuilderAgent")])
+    service = InMemorySessionService()
+    session = await service.create_session(
+        app_name="test", user_id="u", state={"email_sequences": email_sequences},
+    )
+    runner = Runner(agent=agent, app_name="test", session_service=service)
+    async for _ in runner.run_async(
+        user_id="u", session_id=session.id, new_message=Content(role="user", parts=[Part(text="go")]),
+    ):
+        pass
+    session = await service.get_session(app_name="test", user_id="u", session_id=session.id)
+    return session.state["campaign_json"]
+
+
+class TestSequenceBuilderAgent:
+    async def test_valid_sequences_get_schedule_and_footer(self):
+        campaign = await _build(json.dumps({"sequences": [_sequence("1"), _sequence("2")]}))
+
+        assert campaign["lead_count"] == 2
+        assert campaign["validation_errors"] == []
+        seq = campaign["sequences"][0]
+        assert seq["send_schedule"] == {"touch_1": 1, "touch_2": 5, "touch_3": 10}
+        assert "unsubscribe" in seq["unsubscribe_footer"]
+
+    async def test_invalid_sequences_are_dropped_and_reported(self):
+        two_touches = _sequence("2")
+        two_touches["emails"] = two_touches["emails"][:2]
+        sequences = [_sequence("1"), two_touches, _sequence("3", subject="")]
+
+        campaign = await _build(json.dumps({"sequences": sequences}))
+
+        assert [s["lead_id"] for s in campaign["sequences"]] == ["1"]
+        assert [e["lead_id"] for e in campaign["validation_errors"]] == ["2", "3"]
+        assert campaign["validation_errors"][0]["errors"][0]["type"] == "too_short"
+
+    async def test_accepts_sequences_as_python_objects(self):
+        campaign = await _build({"sequences": [_sequence("1")]})
+
+        assert campaign["lead_count"] == 1
+
+    async def test_unparseable_sequences_yield_empty_campaign(self):
+        campaign = await _build("not json")
+
+        assert campaign["lead_count"] == 0
+        assert campaign["sequences"] == []
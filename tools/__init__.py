@@ -1,21 +1,54 @@
-from .exa_tools import exa_search_companies, exa_find_contact
-from .hunter_tools import (
-    hunter_domain_search, hunter_verify_email, hunter_find_email,
-    hunter_create_lead, hunter_add_recipient, hunter_list_campaigns, hunter_start_campaign,
-)
-from .elevenlabs_tools import (
-    elevenlabs_create_conv_agent,
-    elevenlabs_initiate_call,
-    elevenlabs_get_call_status,
-)
-from .calendar_tools import get_free_slots, create_event, get_event
-from .context_harness_tools import ctx_search
+"""Tool functions for the BDR agents.
 
-__all__ = [
-    "exa_search_companies", "exa_find_contact",
-    "hunter_domain_search", "hunter_verify_email", "hunter_find_email",
-    "hunter_create_lead", "hunter_add_recipient", "hunter_list_campaigns", "hunter_start_campaign",
-    "elevenlabs_create_conv_agent", "elevenlabs_initiate_call", "elevenlabs_get_call_status",
-    "get_free_slots", "create_event", "get_event",
-    "ctx_search",
-]
+Submodules are imported on first attribute access (PEP 562), so importing
+one tool module — e.g. ``tools.calendar_tools`` — doesn't also pull in the
+SDKs behind every other tool.
+"""
+import importlib
+
+_LAZY = {
+    "exa_search_companies": "tools.exa_tools",
+    "exa_find_contact": "tools.exa_tools",
+    "exa_search_companies_async": "tools.exa_tools",
+    "exa_find_contact_async": "tools.exa_tools",
+    "pplx_search_multi": "tools.perplexity_tools",
+    "pplx_search_multi_async": "tools.perplexity_tools",
+    "hunter_domain_search": "tools.hunter_tools",
+    "hunter_verify_email": "tools.hunter_tools",
+    "hunter_find_email": "tools.hunter_tools",
+    "hunter_domain_search_async": "tools.hunter_tools",
+    "hunter_verify_email_async": "tools.hunter_tools",
+    "hunter_verify_emails_batch": "tools.hunter_tools",
+    "hunter_find_email_async": "tools.hunter_tools",
+    "hunter_find_and_verify": "tools.hunter_tools",
+    "hunter_find_and_verify_async": "tools.hunter_tools",
+    "hunter_create_lead": "tools.hunter_tools",
+    "hunter_create_lead_async": "tools.hunter_tools",
+    "hunter_create_leads_batch": "tools.hunter_tools",
+    "hunter_add_recipient": "tools.hunter_tools",
+    "hunter_list_campaigns": "tools.hunter_tools",
+    "hunter_start_campaign": "tools.hunter_tools",
+    "elevenlabs_create_conv_agent": "tools.elevenlabs_tools",
+    "elevenlabs_initiate_call": "tools.elevenlabs_tools",
+    "elevenlabs_get_call_status": "tools.elevenlabs_tools",
+    "get_free_slots": "tools.calendar_tools",
+    "create_event": "tools.calendar_tools",
+    "get_event": "tools.calendar_tools",
+    "ctx_search": "tools.context_harness_tools",
+    "ctx_search_async": "tools.context_harness_tools",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
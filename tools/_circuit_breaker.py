@@ -0,0 +1,103 @@
+"""Circuit breaker for HTTP tool calls.
+
+When a provider is down, every tool call would otherwise wait out its
+retries and timeout before failing. After ``threshold`` consecutive outage
+failures the breaker opens and calls fail at once for ``cooldown`` seconds;
+any response from the server closes it again. Client errors (4xx other than
+429) mean the server is up, so they don't count as failures.
+"""
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider while its breaker is open."""
+
+
+def is_outage(exc: Exception) -> bool:
+    """True for connection failures, timeouts, 429s and 5xx responses."""
+    # RetryError is what a session with status retries raises once a 429/5xx
+    # has used them all up; it carries no response to read the status from.
+    outages = (
+        requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError,
+        httpx.TransportError,
+    )
+    if isinstance(exc, outages):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class CircuitBreaker:
+    """Fails calls fast for a cooldown after repeated outage failures."""
+
+    def __init__(self, name: str, threshold: int, cooldown: float):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if the breaker is open."""
+        if self.is_open():
+            raise CircuitOpenError(f"{self.name} unavailable (breaker open)")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                logger.warning("%s down — failing calls fast for %.0fs", self.name, self.cooldown)
+                self._open_until = time.monotonic() + self.cooldown
+                self._failures = 0
+
+    def record(self, exc: Exception) -> None:
+        """Count exc as a failure if it signals an outage, else as a response."""
+        if is_outage(exc):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+
+    def call(self, send: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Send a request through the breaker and raise for HTTP error statuses."""
+        self.check()
+        try:
+            resp = send(*args, **kwargs)
+            resp.raise_for_status()
+        except Exception as exc:
+            self.record(exc)
+            raise
+        self.record_success()
+        return resp
+
+    async def call_async(self, send: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Async counterpart of call()."""
+        self.check()
+        try:
+            resp = await send(*args, **kwargs)
+            resp.raise_for_status()
+        except Exception as exc:
+            self.record(exc)
+            raise
+        self.record_success()
+        return resp
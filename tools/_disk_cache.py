@@ -0,0 +1,43 @@
+"""Tiny JSON-on-disk cache for tool responses.
+
+Entries live at ``.cache/<namespace>/<sha256>.json`` (root overridable with
+TOOL_CACHE_DIR) and expire by file mtime. Writes are atomic, so concurrent
+agents never read a half-written entry.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+_DEFAULT_ROOT = Path(__file__).parent.parent / ".cache"
+
+
+def _path(namespace: str, key: Sequence[Any]) -> Path:
+    root = Path(os.environ.get("TOOL_CACHE_DIR", _DEFAULT_ROOT))
+    digest = hashlib.sha256(json.dumps(list(key)).encode()).hexdigest()
+    return root / namespace / f"{digest}.json"
+
+
+def load(namespace: str, key: Sequence[Any], ttl_seconds: float) -> Optional[Any]:
+    """Return the cached value for key, or None if missing or older than ttl."""
+    path = _path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(namespace: str, key: Sequence[Any], value: Any) -> None:
+    """Write value for key. Best effort — a failed write only costs a cache miss."""
+    path = _path(namespace, key)
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(value))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,15 @@
+"""Fast JSON decoding for HTTP tool responses.
+
+``pydantic_core.from_json`` parses the raw response bytes directly, skipping
+the text decode that ``Response.json()`` does first, and is several times
+faster than stdlib ``json`` on large payloads (Hunter domain searches and
+campaign lists). Works for both ``requests`` and ``httpx`` responses.
+"""
+from typing import Any
+
+from pydantic_core import from_json
+
+
+def response_json(resp: Any) -> Any:
+    """Decode an HTTP response body as JSON. Raises ValueError if invalid."""
+    return from_json(resp.content)
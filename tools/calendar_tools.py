@@ -1,7 +1,10 @@
 """Google Calendar tools for Google ADK agents."""
+import bisect
+import functools
 import os
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+import threading
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from google.oauth2 import service_account
@@ -11,18 +14,81 @@ from googleapiclient.discovery import build
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
 
+# Built clients, one per thread: the httplib2 transport underneath isn't
+# thread-safe, and ADK may run sync tools on a thread pool.
+_local = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _credentials(creds_path: str) -> service_account.Credentials:
+    return service_account.Credentials.from_service_account_file(
+        creds_path, scopes=SCOPES
+    )
+
+
+# The public tools take an optional ``_service_obj`` so tests can inject a
+# fake client. ADK leaves underscore-prefixed parameters out of the tool
+# schema, so the model never sees it.
 def _service():
     creds_path = os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
-    creds = service_account.Credentials.from_service_account_file(
-        creds_path, scopes=SCOPES
+    cached = getattr(_local, "service", None)
+    if cached is None or cached[0] != creds_path:
+        # static_discovery reads the bundled discovery doc instead of fetching it.
+        service = build(
+            "calendar", "v3",
+            credentials=_credentials(creds_path),
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        _local.service = cached = (creds_path, service)
+    return cached[1]
+
+
+def _merge_busy(busy_periods: List[Dict[str, str]]) -> Tuple[List[datetime], List[datetime]]:
+    """Parse freebusy periods once; return sorted, merged (starts, ends)."""
+    intervals = sorted(
+        (datetime.fromisoformat(b["start"]), datetime.fromisoformat(b["end"]))
+        for b in busy_periods
     )
-    return build("calendar", "v3", credentials=creds)
+    starts: List[datetime] = []
+    ends: List[datetime] = []
+    for start, end in intervals:
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+SLOT_HOURS = (9, 10, 11, 14, 15, 16)
+SLOTS_OFFERED = 3  # slots returned to the booking agent per request
+_SLOT_TIMES = tuple(time(hour) for hour in SLOT_HOURS)
+
+
+def _candidate_slots(
+    now: datetime, time_max: datetime, duration: timedelta,
+) -> List[Tuple[datetime, datetime]]:
+    """(start, end) meeting slots on business days from the next 9am, in order."""
+    tz = now.tzinfo
+    first = datetime.combine(now.date(), _SLOT_TIMES[0], tz)
+    if first < now:
+        first += timedelta(days=1)
+    dates = [first.date() + timedelta(days=d) for d in range((time_max - first).days + 1)]
+    return [
+        (start, start + duration)
+        for date in dates
+        if date.weekday() < 5  # Mon–Fri
+        for start in (datetime.combine(date, slot_time, tz) for slot_time in _SLOT_TIMES)
+        if start + duration <= time_max
+    ]
 
 
 def get_free_slots(
     duration_minutes: int = 30,
     days_ahead: int = 7,
     calendar_id: Optional[str] = None,
+    _service_obj: Any = None,
 ) -> Dict[str, Any]:
     """Get available time slots from Declan's calendar.
 
@@ -40,7 +106,7 @@ def get_free_slots(
     time_max = now_utc + timedelta(days=days_ahead)
 
     try:
-        service = _service()
+        service = _service_obj or _service()
         body = {
             "timeMin": now_utc.isoformat(),
             "timeMax": time_max.isoformat(),
@@ -49,40 +115,25 @@ def get_free_slots(
         result = service.freebusy().query(body=body).execute()
         busy_periods = result.get("calendars", {}).get(cal_id, {}).get("busy", [])
 
-        # Build candidate slots: 9am–5pm on business days (America/Chicago)
+        busy_starts, busy_ends = _merge_busy(busy_periods)
+
         slots = []
-        cursor = now_chicago.replace(hour=9, minute=0, second=0, microsecond=0)
-        if cursor < now_chicago:
-            cursor += timedelta(days=1)
-
-        while cursor < time_max and len(slots) < 10:
-            if cursor.weekday() < 5:  # Mon–Fri
-                for hour in [9, 10, 11, 14, 15, 16]:
-                    candidate_start = cursor.replace(hour=hour, minute=0)
-                    candidate_end = candidate_start + timedelta(minutes=duration_minutes)
-                    if candidate_end > time_max:
-                        continue
-                    # Check against busy periods
-                    conflict = False
-                    for busy in busy_periods:
-                        b_start = datetime.fromisoformat(busy["start"])
-                        b_end = datetime.fromisoformat(busy["end"])
-                        if candidate_start < b_end and candidate_end > b_start:
-                            conflict = True
-                            break
-                    if not conflict:
-                        slots.append({
-                            "start_datetime": candidate_start.isoformat(),
-                            "end_datetime": candidate_end.isoformat(),
-                            "timezone": "America/Chicago",
-                        })
-                        if len(slots) >= 6:
-                            break
-            cursor += timedelta(days=1)
-
-        # Return 3 diverse slots (morning, afternoon spread)
-        selected = slots[:3] if len(slots) >= 3 else slots
-        return {"slots": selected, "calendar_id": cal_id}
+        duration = timedelta(minutes=duration_minutes)
+        for candidate_start, candidate_end in _candidate_slots(now_chicago, time_max, duration):
+            # Last busy interval starting before the candidate ends;
+            # merged intervals don't overlap, so it's the only one to check.
+            i = bisect.bisect_left(busy_starts, candidate_end) - 1
+            if i >= 0 and busy_ends[i] > candidate_start:
+                continue
+            slots.append({
+                "start_datetime": candidate_start.isoformat(),
+                "end_datetime": candidate_end.isoformat(),
+                "timezone": "America/Chicago",
+            })
+            if len(slots) >= SLOTS_OFFERED:
+                break
+
+        return {"slots": slots, "calendar_id": cal_id}
     except Exception as exc:
         return {"slots": [], "error": str(exc)}
 
@@ -95,6 +146,7 @@ def create_event(
     description: str = "",
     timezone: str = "America/Chicago",
     calendar_id: Optional[str] = None,
+    _service_obj: Any = None,
 ) -> Dict[str, Any]:
     """Create a Google Calendar event and send invite to the attendee.
 
@@ -126,7 +178,7 @@ def create_event(
         "sendUpdates": "all",
     }
     try:
-        service = _service()
+        service = _service_obj or _service()
         created = (
             service.events()
             .insert(
@@ -151,7 +203,11 @@ def create_event(
         return {"event_id": "", "status": "error", "error": str(exc)}
 
 
-def get_event(event_id: str, calendar_id: Optional[str] = None) -> Dict[str, Any]:
+def get_event(
+    event_id: str,
+    calendar_id: Optional[str] = None,
+    _service_obj: Any = None,
+) -> Dict[str, Any]:
     """Fetch a calendar event by ID to verify it was created.
 
     Args:
@@ -163,7 +219,7 @@ def get_event(event_id: str, calendar_id: Optional[str] = None) -> Dict[str, Any
     """
     cal_id = calendar_id or os.environ["DECLAN_CALENDAR_ID"]
     try:
-        service = _service()
+        service = _service_obj or _service()
         event = service.events().get(calendarId=cal_id, eventId=event_id).execute()
         return {
             "event_id": event.get("id"),
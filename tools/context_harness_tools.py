@@ -1,12 +1,47 @@
-"""context-harness MCP search tool for Google ADK agents."""
+"""context-harness MCP search tool for Google ADK agents.
+
+``ctx_search`` is the blocking version; agents use ``ctx_search_async`` so
+concurrent tool calls (e.g. across the per-lead fan-out) overlap their I/O.
+"""
+import asyncio
+import functools
 import logging
 import os
 from typing import Any, Dict
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools._circuit_breaker import CircuitBreaker
+from tools._json import response_json
 
 logger = logging.getLogger(__name__)
 
+# One pooled session for all searches: the per-lead fan-out issues many
+# ctx_search calls back to back, and reusing connections skips the TCP
+# setup on each one.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=200,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+# Once open, searches return the fail-open result at once instead of each
+# waiting out connect retries and the timeout.
+_BREAKER = CircuitBreaker("context-harness", threshold=3, cooldown=30.0)
+
+
+def _endpoint() -> tuple[str, int]:
+    """Server URL and timeout, read per call so env changes apply without a reload."""
+    base_url = os.environ.get("CTX_MCP_URL", "http://127.0.0.1:7331")
+    return base_url, int(os.environ.get("CTX_SEARCH_TIMEOUT", "5"))
+
 
 def ctx_search(query: str, limit: int = 5) -> Dict[str, Any]:
     """Search the context-harness knowledge base.
@@ -22,18 +57,59 @@ def ctx_search(query: str, limit: int = 5) -> Dict[str, Any]:
     Returns:
         Dict with 'results' list and 'query' echo. On error, includes 'error' key.
     """
-    base_url = os.environ.get("CTX_MCP_URL", "http://127.0.0.1:7331")
-    timeout = int(os.environ.get("CTX_SEARCH_TIMEOUT", "5"))
+    base_url, timeout = _endpoint()
     try:
-        resp = requests.post(
+        resp = _BREAKER.call(
+            _SESSION.post,
             f"{base_url}/tools/search",
             json={"query": query, "limit": limit},
             timeout=timeout,
         )
-        resp.raise_for_status()
-        return {"results": resp.json().get("results", []), "query": query}
+        return {"results": response_json(resp).get("results", []), "query": query}
     except requests.exceptions.ConnectionError:
         logger.warning("context-harness not reachable — search skipped")
         return {"results": [], "query": query, "error": "context-harness unavailable"}
     except Exception as exc:
         return {"results": [], "query": query, "error": str(exc)}
+
+
+# Shared async client + cap on in-flight requests for ctx_search_async.
+_ASYNC_SEMAPHORE = asyncio.Semaphore(20)
+
+
+@functools.cache
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    )
+
+
+async def ctx_search_async(query: str, limit: int = 5) -> Dict[str, Any]:
+    """Search the context-harness knowledge base.
+
+    Queries the local context-harness MCP server for relevant history,
+    playbook content, or past campaign data. Fails open — if the server
+    is not running, returns empty results so the pipeline can continue.
+
+    Args:
+        query: Natural language search query.
+        limit: Maximum number of results to return (default 5).
+
+    Returns:
+        Dict with 'results' list and 'query' echo. On error, includes 'error' key.
+    """
+    base_url, timeout = _endpoint()
+    try:
+        async with _ASYNC_SEMAPHORE:
+            resp = await _BREAKER.call_async(
+                _async_client().post,
+                f"{base_url}/tools/search",
+                json={"query": query, "limit": limit},
+                timeout=timeout,
+            )
+        return {"results": response_json(resp).get("results", []), "query": query}
+    except httpx.ConnectError:
+        logger.warning("context-harness not reachable — search skipped")
+        return {"results": [], "query": query, "error": "context-harness unavailable"}
+    except Exception as exc:
+        return {"results": [], "query": query, "error": str(exc)}
@@ -8,18 +8,33 @@ import os
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools._circuit_breaker import CircuitBreaker
+from tools._json import response_json
 
 logger = logging.getLogger(__name__)
 
 
 ELEVENLABS_BASE = "https://api.elevenlabs.io/v1"
 
+# One pooled session, so a booking turn's create-agent / call / status calls
+# reuse the TLS connection to api.elevenlabs.io. Status retries apply to GETs
+# only — urllib3 never retries a POST on status, so a call is never placed twice.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+_BREAKER = CircuitBreaker("ElevenLabs", threshold=5, cooldown=60.0)
+
 
 def _headers() -> Dict[str, str]:
-    return {
-        "xi-api-key": os.environ["ELEVENLABS_API_KEY"],
-        "Content-Type": "application/json",
-    }
+    # Key read per call: .env may be loaded after this module is imported.
+    # Content-Type comes from requests' json= encoding.
+    return {"xi-api-key": os.environ["ELEVENLABS_API_KEY"]}
 
 
 def elevenlabs_create_conv_agent(
@@ -55,14 +70,14 @@ def elevenlabs_create_conv_agent(
         },
     }
     try:
-        resp = requests.post(
+        resp = _BREAKER.call(
+            _SESSION.post,
             f"{ELEVENLABS_BASE}/convai/agents/create",
             headers=_headers(),
             json=payload,
             timeout=15,
         )
-        resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
         agent_id = data.get("agent_id", "")
         logger.info(
             "Created new ElevenLabs agent: %s — set ELEVENLABS_CONV_AGENT_ID=%s in .env to reuse it",
@@ -100,14 +115,14 @@ def elevenlabs_initiate_call(
         payload["metadata"] = metadata
 
     try:
-        resp = requests.post(
+        resp = _BREAKER.call(
+            _SESSION.post,
             f"{ELEVENLABS_BASE}/convai/twilio/outbound-call",
             headers=_headers(),
             json=payload,
             timeout=15,
         )
-        resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
         return {
             "call_id": data.get("callSid", data.get("call_id", "")),
             "status": "initiated",
@@ -126,13 +141,13 @@ def elevenlabs_get_call_status(call_id: str) -> Dict[str, Any]:
         Dict with 'status', 'transcript', 'outcome'.
     """
     try:
-        resp = requests.get(
+        resp = _BREAKER.call(
+            _SESSION.get,
             f"{ELEVENLABS_BASE}/convai/calls/{call_id}",
             headers=_headers(),
             timeout=10,
         )
-        resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
         return {
             "call_id": call_id,
             "status": data.get("status", "unknown"),
@@ -2,21 +2,111 @@
 
 Uses highlights mode for token-efficient results (Exa best practice for agentic
 workflows). See https://exa.ai/docs/reference/search-best-practices
+
+The ``*_async`` variants use ``AsyncExa`` so agents' concurrent tool calls
+overlap instead of blocking the event loop one search at a time. The contact
+lookups issue their sub-queries concurrently in both variants.
+
+Successful results are cached on disk for 24 h (see tools/_disk_cache.py),
+keyed by the normalized query and search options; pass ``_bypass_cache=True``
+to force a live search (ADK leaves underscore-prefixed parameters out of the
+tool schema, so the model never sees it). Concurrent async calls with the same
+key share one live search (see tools/singleflight.py).
 """
+import asyncio
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from exa_py import Exa
+from exa_py import AsyncExa, Exa
+
+from tools import _disk_cache
+from tools.singleflight import Singleflight
+
+# Cap on in-flight async Exa searches across all agents (provider rate limit).
+_ASYNC_SEMAPHORE = asyncio.Semaphore(20)
+
+# Coalesces identical concurrent async searches (same key as the disk cache).
+_INFLIGHT = Singleflight()
+
+# Runs exa_find_contact's sub-queries side by side, so the sync tool's latency
+# is the slowest search rather than the sum of all of them.
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="exa")
+
+_CACHE_NAMESPACE = "exa"
+_CACHE_TTL_SECONDS = 24 * 3600
+
+
+# One SDK client per API key. AsyncExa opens its own httpx client on first
+# use, so reusing the instance keeps connections to api.exa.ai alive across
+# searches instead of handshaking for every call.
+@functools.lru_cache(maxsize=4)
+def _client_for(api_key: str) -> Exa:
+    return Exa(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _async_client_for(api_key: str) -> AsyncExa:
+    return AsyncExa(api_key=api_key)
 
 
 def _client() -> Exa:
-    return Exa(api_key=os.environ["EXA_API_KEY"])
+    return _client_for(os.environ["EXA_API_KEY"])
+
+
+def _async_client() -> AsyncExa:
+    return _async_client_for(os.environ["EXA_API_KEY"])
+
+
+def _contact_queries(company_name: str, domain: str) -> List[str]:
+    return [
+        f"{company_name} VP Marketing director email",
+        f"site:{domain} team leadership marketing",
+        f"{company_name} executive director membership",
+    ]
+
+
+def _norm(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _companies_key(query: str, num_results: int, category: str) -> tuple:
+    return ("search_companies", _norm(query), category, min(num_results, 25))
+
+
+def _contact_key(company_name: str, domain: str) -> tuple:
+    return ("find_contact", _norm(company_name), _norm(domain))
+
+
+def _cached(key: tuple, bypass_cache: bool) -> Optional[Dict[str, Any]]:
+    if bypass_cache:
+        return None
+    return _disk_cache.load(_CACHE_NAMESPACE, key, _CACHE_TTL_SECONDS)
+
+
+def _remember(key: tuple, result: Dict[str, Any], bypass_cache: bool) -> Dict[str, Any]:
+    if not bypass_cache and "error" not in result:
+        _disk_cache.store(_CACHE_NAMESPACE, key, result)
+    return result
+
+
+def _result_dicts(response) -> List[Dict[str, Any]]:
+    return [
+        {
+            "url": r.url,
+            "title": r.title or "",
+            "highlights": r.highlights or [],
+        }
+        for r in response.results
+    ]
 
 
 def exa_search_companies(
     query: str,
     num_results: int = 10,
     category: str = "company",
+    _bypass_cache: bool = False,
 ) -> Dict[str, Any]:
     """Search for companies using Exa semantic search.
 
@@ -28,6 +118,10 @@ def exa_search_companies(
     Returns:
         Dict with 'results' list, each containing url, title, highlights.
     """
+    key = _companies_key(query, num_results, category)
+    cached = _cached(key, _bypass_cache)
+    if cached is not None:
+        return cached
     try:
         client = _client()
         response = client.search(
@@ -41,20 +135,12 @@ def exa_search_companies(
                 }
             },
         )
-        results = [
-            {
-                "url": r.url,
-                "title": r.title or "",
-                "highlights": r.highlights or [],
-            }
-            for r in response.results
-        ]
-        return {"results": results, "query": query}
+        return _remember(key, {"results": _result_dicts(response), "query": query}, _bypass_cache)
     except Exception as exc:
         return {"results": [], "query": query, "error": str(exc)}
 
 
-def exa_find_contact(company_name: str, domain: str) -> Dict[str, Any]:
+def exa_find_contact(company_name: str, domain: str, _bypass_cache: bool = False) -> Dict[str, Any]:
     """Search for decision-maker contact info for a company.
 
     Args:
@@ -64,14 +150,13 @@ def exa_find_contact(company_name: str, domain: str) -> Dict[str, Any]:
     Returns:
         Dict with 'results' containing contact clues found.
     """
-    queries = [
-        f"{company_name} VP Marketing director email",
-        f"site:{domain} team leadership marketing",
-        f"{company_name} executive director membership",
-    ]
-    all_results: List[Dict] = []
+    key = _contact_key(company_name, domain)
+    cached = _cached(key, _bypass_cache)
+    if cached is not None:
+        return cached
     client = _client()
-    for q in queries:
+
+    def search(q: str) -> List[Dict[str, Any]]:
         try:
             resp = client.search(
                 q,
@@ -84,12 +169,105 @@ def exa_find_contact(company_name: str, domain: str) -> Dict[str, Any]:
                     }
                 },
             )
-            for r in resp.results:
-                all_results.append({
-                    "url": r.url,
-                    "title": r.title or "",
-                    "highlights": r.highlights or [],
-                })
+            return _result_dicts(resp)
+        except Exception:
+            return []
+
+    per_query = _SEARCH_POOL.map(search, _contact_queries(company_name, domain))
+    all_results = [r for results in per_query for r in results]
+    result = {"results": all_results, "company": company_name, "domain": domain}
+    return _remember(key, result, _bypass_cache) if all_results else result
+
+
+async def exa_search_companies_async(
+    query: str,
+    num_results: int = 10,
+    category: str = "company",
+    _bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Search for companies using Exa semantic search.
+
+    Args:
+        query: Natural language search query.
+        num_results: Number of results to return (max 25).
+        category: Exa category filter (default: "company").
+
+    Returns:
+        Dict with 'results' list, each containing url, title, highlights.
+    """
+    key = _companies_key(query, num_results, category)
+    cached = _cached(key, _bypass_cache)
+    if cached is not None:
+        return cached
+    return await _INFLIGHT.do(
+        key, lambda: _search_companies_live(query, num_results, category, key, _bypass_cache),
+    )
+
+
+async def _search_companies_live(
+    query: str, num_results: int, category: str, key: tuple, bypass_cache: bool,
+) -> Dict[str, Any]:
+    try:
+        async with _ASYNC_SEMAPHORE:
+            response = await _async_client().search(
+                query,
+                num_results=min(num_results, 25),
+                type="auto",
+                category=category,
+                contents={
+                    "highlights": {
+                        "maxCharacters": 4000,
+                    }
+                },
+            )
+        return _remember(key, {"results": _result_dicts(response), "query": query}, bypass_cache)
+    except Exception as exc:
+        return {"results": [], "query": query, "error": str(exc)}
+
+
+async def exa_find_contact_async(
+    company_name: str,
+    domain: str,
+    _bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Search for decision-maker contact info for a company.
+
+    Args:
+        company_name: Company name.
+        domain: Company domain (e.g. example.com).
+
+    Returns:
+        Dict with 'results' containing contact clues found.
+    """
+    key = _contact_key(company_name, domain)
+    cached = _cached(key, _bypass_cache)
+    if cached is not None:
+        return cached
+    return await _INFLIGHT.do(key, lambda: _find_contact_live(company_name, domain, key, _bypass_cache))
+
+
+async def _find_contact_live(company_name: str, domain: str, key: tuple, bypass_cache: bool) -> Dict[str, Any]:
+    client = _async_client()
+
+    async def search(q: str) -> List[Dict[str, Any]]:
+        try:
+            async with _ASYNC_SEMAPHORE:
+                resp = await client.search(
+                    q,
+                    num_results=3,
+                    type="auto",
+                    category="people",
+                    contents={
+                        "highlights": {
+                            "maxCharacters": 2000,
+                        }
+                    },
+                )
+            return _result_dicts(resp)
         except Exception:
-            continue
-    return {"results": all_results, "company": company_name, "domain": domain}
+            return []
+
+    per_query = await asyncio.gather(*(search(q) for q in _contact_queries(company_name, domain)))
+    all_results = [r for results in per_query for r in results]
+    result = {"results": all_results, "company": company_name, "domain": domain}
+    return _remember(key, result, bypass_cache) if all_results else result
@@ -2,17 +2,56 @@
 
 Calls Hunter.io REST API directly (no official Python SDK).
 """
+import asyncio
+import functools
 import logging
 import os
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools._circuit_breaker import CircuitBreaker
+from tools._json import response_json
+from tools._ttl_cache import TTLCache
+from tools.singleflight import Singleflight
 
 logger = logging.getLogger(__name__)
 
 
 HUNTER_BASE = "https://api.hunter.io/v2"
+
+# One pooled session for all Hunter calls, so enrichment across a lead list
+# reuses the TLS connection to api.hunter.io instead of handshaking per call.
+# Retries cover rate limits and gateway errors on idempotent requests only
+# (urllib3's default allowed_methods excludes POST).
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+))
+# Shared by the sync and async clients: during a Hunter outage, calls fail
+# fast instead of each one waiting out its retries.
+_BREAKER = CircuitBreaker("Hunter", threshold=5, cooldown=60.0)
+# Successful responses for data that rarely changes within a run. Campaign
+# state is dropped whenever this module changes it (see
+# hunter_invalidate_campaigns). Verifier and finder lookups cost credits, so
+# they are kept for a day: re-runs over the same leads don't pay twice.
+_DOMAIN_CACHE = TTLCache(maxsize=2048, ttl=3600)
+_VERIFY_CACHE = TTLCache(maxsize=4096, ttl=86400)
+_FIND_CACHE = TTLCache(maxsize=2048, ttl=86400)
+# Finder 404s (no such person at the domain) are remembered for an hour so
+# agents retrying the same name don't pay for the same miss again.
+_FIND_MISS_CACHE = TTLCache(maxsize=4096, ttl=3600)
+# "unknown" verdicts are often transient (the recipient's server timed out or
+# greylisted the check), so they and "invalid" are only kept for an hour.
+_VERIFY_MISS_CACHE = TTLCache(maxsize=4096, ttl=3600)
+_VERIFY_MISS_STATUSES = {"unknown", "invalid"}
+_CAMPAIGNS_CACHE = TTLCache(maxsize=16, ttl=60)
+
 PRIORITY_TITLES = [
     "vp marketing", "director of events", "director marketing", "cmo",
     "chief marketing", "executive director", "membership director",
@@ -21,10 +60,123 @@ PRIORITY_TITLES = [
 ]
 
 
+def _title_priority(title: str) -> int:
+    """Index of the first PRIORITY_TITLES entry in title (99 if none); lower sorts first.
+
+    Plain substring checks: on job-title-length strings they beat a combined
+    regex (with or without lookahead for overlapping titles) several times over.
+    """
+    title_lower = title.lower()
+    for i, t in enumerate(PRIORITY_TITLES):
+        if t in title_lower:
+            return i
+    return 99
+
+
 def _api_key() -> str:
     return os.environ["HUNTER_API_KEY"]
 
 
+def _domain_key(domain: str, limit: int) -> tuple:
+    return (domain.strip().lower(), limit)
+
+
+def _email_key(email: str) -> str:
+    return email.strip().lower()
+
+
+def _find_key(domain: str, first_name: str, last_name: str) -> tuple:
+    return (domain.strip().lower(), first_name.strip().lower(), last_name.strip().lower())
+
+
+def _is_not_found(exc: Exception) -> bool:
+    """True for an HTTP 404 from either the requests or the httpx client."""
+    response = getattr(exc, "response", None)
+    return response is not None and getattr(response, "status_code", None) == 404
+
+
+def _find_miss(key: tuple, exc: Exception) -> Dict[str, Any]:
+    result = {"email": "", "verified": False, "error": str(exc)}
+    if _is_not_found(exc):
+        _FIND_MISS_CACHE.set(key, result)
+    return result
+
+
+def _domain_search_result(domain: str, data: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    contacts = []
+    for email_entry in data.get("emails", []):
+        full_name = f"{email_entry.get('first_name', '')} {email_entry.get('last_name', '')}".strip()
+        contacts.append({
+            "name": full_name,
+            "title": email_entry.get("position", ""),
+            "email": email_entry.get("value", ""),
+            "verified": email_entry.get("verification", {}).get("status") == "valid",
+        })
+
+    contacts.sort(key=lambda c: _title_priority(c["title"] or ""))
+
+    return {
+        "domain": domain,
+        "organization": data.get("organization", ""),
+        "email_pattern": data.get("pattern", ""),
+        "contacts": contacts[:limit],
+    }
+
+
+def _cached_verification(key: str) -> Optional[Dict[str, Any]]:
+    cached = _VERIFY_CACHE.get(key)
+    return cached if cached is not None else _VERIFY_MISS_CACHE.get(key)
+
+
+def _remember_verification(key: str, data: Dict[str, Any]) -> None:
+    cache = _VERIFY_MISS_CACHE if data.get("status") in _VERIFY_MISS_STATUSES else _VERIFY_CACHE
+    cache.set(key, data)
+
+
+def _verify_result(email: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "email": email,
+        "status": data.get("status", "unknown"),
+        "score": data.get("score", 0),
+        "verified": data.get("status") == "valid",
+    }
+
+
+# Finder scores at or above this are trusted without a verifier call; below
+# FINDER_MIN_SCORE the address isn't worth verifying at all.
+VERIFY_THRESHOLD = 90
+FINDER_MIN_SCORE = 70
+
+
+def _find_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    score = data.get("score") or 0
+    return {
+        "email": data.get("email", ""),
+        "score": score,
+        "verified": score >= FINDER_MIN_SCORE,
+    }
+
+
+def _trusted_find(found: Dict[str, Any], verify_threshold: int) -> Optional[Dict[str, Any]]:
+    """The final find-and-verify result when the finder score decides it, else None."""
+    if "error" in found or not found.get("email"):
+        return {**found, "verified": False, "verified_by": None}
+    if found["score"] >= verify_threshold:
+        return {**found, "verified": True, "verified_by": "score"}
+    if found["score"] < FINDER_MIN_SCORE:
+        return {**found, "verified": False, "verified_by": None}
+    return None
+
+
+def _verified_find(found: Dict[str, Any], verification: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **found,
+        "verified": verification["verified"],
+        "verified_by": "verifier",
+        "status": verification["status"],
+    }
+
+
 def hunter_domain_search(domain: str, limit: int = 5) -> Dict[str, Any]:
     """Search Hunter.io for email addresses at a domain.
 
@@ -35,42 +187,20 @@ def hunter_domain_search(domain: str, limit: int = 5) -> Dict[str, Any]:
     Returns:
         Dict with 'pattern', 'contacts' list, and 'organization'.
     """
+    key = _domain_key(domain, limit)
+    cached = _DOMAIN_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
-        params = urlencode({
-            "domain": domain,
-            "limit": limit,
-            "api_key": _api_key(),
-        })
-        resp = requests.get(f"{HUNTER_BASE}/domain-search?{params}", timeout=10)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-
-        contacts = []
-        for email_entry in data.get("emails", []):
-            full_name = f"{email_entry.get('first_name', '')} {email_entry.get('last_name', '')}".strip()
-            contacts.append({
-                "name": full_name,
-                "title": email_entry.get("position", ""),
-                "email": email_entry.get("value", ""),
-                "verified": email_entry.get("verification", {}).get("status") == "valid",
-            })
-
-        # Sort: prioritize decision-maker titles
-        def _priority(c: Dict) -> int:
-            title_lower = c.get("title", "").lower()
-            for i, t in enumerate(PRIORITY_TITLES):
-                if t in title_lower:
-                    return i
-            return 99
-
-        contacts.sort(key=_priority)
-
-        return {
-            "domain": domain,
-            "organization": data.get("organization", ""),
-            "email_pattern": data.get("pattern", ""),
-            "contacts": contacts[:limit],
-        }
+        resp = _BREAKER.call(
+            _SESSION.get,
+            f"{HUNTER_BASE}/domain-search",
+            params={"domain": domain, "limit": limit, "api_key": _api_key()},
+            timeout=10,
+        )
+        result = _domain_search_result(domain, response_json(resp).get("data", {}), limit)
+        _DOMAIN_CACHE.set(key, result)
+        return result
     except Exception as exc:
         return {"domain": domain, "contacts": [], "error": str(exc)}
 
@@ -84,17 +214,20 @@ def hunter_verify_email(email: str) -> Dict[str, Any]:
     Returns:
         Dict with 'email', 'status' (valid/invalid/accept_all/unknown), 'score'.
     """
+    key = _email_key(email)
+    cached = _cached_verification(key)
+    if cached is not None:
+        return _verify_result(email, cached)
     try:
-        params = urlencode({"email": email, "api_key": _api_key()})
-        resp = requests.get(f"{HUNTER_BASE}/email-verifier?{params}", timeout=10)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-        return {
-            "email": email,
-            "status": data.get("status", "unknown"),
-            "score": data.get("score", 0),
-            "verified": data.get("status") == "valid",
-        }
+        resp = _BREAKER.call(
+            _SESSION.get,
+            f"{HUNTER_BASE}/email-verifier",
+            params={"email": email, "api_key": _api_key()},
+            timeout=10,
+        )
+        data = response_json(resp).get("data", {})
+        _remember_verification(key, data)
+        return _verify_result(email, data)
     except Exception as exc:
         return {"email": email, "status": "unknown", "verified": False, "error": str(exc)}
 
@@ -114,23 +247,217 @@ def hunter_find_email(
     Returns:
         Dict with 'email', 'score', 'verified'.
     """
+    key = _find_key(domain, first_name, last_name)
+    cached = _FIND_CACHE.get(key) or _FIND_MISS_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
-        params = urlencode({
-            "domain": domain,
-            "first_name": first_name,
-            "last_name": last_name,
-            "api_key": _api_key(),
-        })
-        resp = requests.get(f"{HUNTER_BASE}/email-finder?{params}", timeout=10)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-        return {
-            "email": data.get("email", ""),
-            "score": data.get("score", 0),
-            "verified": data.get("score", 0) >= 70,
-        }
+        resp = _BREAKER.call(
+            _SESSION.get,
+            f"{HUNTER_BASE}/email-finder",
+            params={
+                "domain": domain,
+                "first_name": first_name,
+                "last_name": last_name,
+                "api_key": _api_key(),
+            },
+            timeout=10,
+        )
+        result = _find_result(response_json(resp).get("data", {}))
+        _FIND_CACHE.set(key, result)
+        return result
+    except Exception as exc:
+        return _find_miss(key, exc)
+
+
+def hunter_find_and_verify(
+    domain: str,
+    first_name: str,
+    last_name: str,
+    verify_threshold: int = VERIFY_THRESHOLD,
+) -> Dict[str, Any]:
+    """Find a person's email via Hunter.io, verifying it only when the score is borderline.
+
+    Prefer this over hunter_find_email followed by hunter_verify_email:
+    high-confidence finds skip the verifier (and its credit) entirely.
+
+    Args:
+        domain: Company domain.
+        first_name: Contact's first name.
+        last_name: Contact's last name.
+        verify_threshold: Finder score at or above which the email is
+            trusted without a verifier call (default 90).
+
+    Returns:
+        Dict with 'email', 'score', 'verified', and 'verified_by'
+        ('score', 'verifier', or None).
+    """
+    found = hunter_find_email(domain, first_name, last_name)
+    trusted = _trusted_find(found, verify_threshold)
+    if trusted is not None:
+        return trusted
+    return _verified_find(found, hunter_verify_email(found["email"]))
+
+
+# ---------------------------------------------------------------------------
+# Async variants — for agents that enrich many leads in one turn
+# ---------------------------------------------------------------------------
+# Hunter rate-limits per key, so in-flight requests are capped well below the
+# connection pool size.
+_ASYNC_SEMAPHORE = asyncio.Semaphore(8)
+# Verifying the same address twice at once (e.g. a contact found by both
+# domain search and email finder) shares one request.
+_INFLIGHT = Singleflight()
+
+
+@functools.cache
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=HUNTER_BASE,
+        timeout=10,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=30),
+        transport=httpx.AsyncHTTPTransport(retries=2),
+    )
+
+
+async def _get_data(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async with _ASYNC_SEMAPHORE:
+        # Key in a header, not the query string httpx logs at INFO.
+        resp = await _BREAKER.call_async(
+            _async_client().get, path, params=params, headers={"X-API-KEY": _api_key()},
+        )
+    return response_json(resp).get("data", {})
+
+
+async def _post_data(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async with _ASYNC_SEMAPHORE:
+        resp = await _BREAKER.call_async(
+            _async_client().post, path, json=payload, headers={"X-API-KEY": _api_key()},
+        )
+    return response_json(resp).get("data", {})
+
+
+async def hunter_domain_search_async(domain: str, limit: int = 5) -> Dict[str, Any]:
+    """Search Hunter.io for email addresses at a domain.
+
+    Args:
+        domain: Company domain to search (e.g. example.com).
+        limit: Max contacts to return (default 5).
+
+    Returns:
+        Dict with 'pattern', 'contacts' list, and 'organization'.
+    """
+    key = _domain_key(domain, limit)
+    cached = _DOMAIN_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        data = await _get_data("/domain-search", {"domain": domain, "limit": limit})
+        result = _domain_search_result(domain, data, limit)
+        _DOMAIN_CACHE.set(key, result)
+        return result
+    except Exception as exc:
+        return {"domain": domain, "contacts": [], "error": str(exc)}
+
+
+async def hunter_verify_email_async(email: str) -> Dict[str, Any]:
+    """Verify whether an email address is valid via Hunter.io.
+
+    Args:
+        email: Email address to verify.
+
+    Returns:
+        Dict with 'email', 'status' (valid/invalid/accept_all/unknown), 'score'.
+    """
+    key = _email_key(email)
+    cached = _cached_verification(key)
+    if cached is not None:
+        return _verify_result(email, cached)
+    try:
+        data = await _INFLIGHT.do(
+            ("verify", key),
+            lambda: _get_data("/email-verifier", {"email": email}),
+        )
+        _remember_verification(key, data)
+        return _verify_result(email, data)
+    except Exception as exc:
+        return {"email": email, "status": "unknown", "verified": False, "error": str(exc)}
+
+
+async def hunter_verify_emails_batch(emails: List[str]) -> Dict[str, Any]:
+    """Verify several email addresses at once via Hunter.io.
+
+    Prefer this over repeated hunter_verify_email calls: all addresses are
+    checked concurrently in a single tool call.
+
+    Args:
+        emails: Email addresses to verify.
+
+    Returns:
+        Dict with 'results' — one hunter_verify_email result per address,
+        in input order.
+    """
+    results = await asyncio.gather(*(hunter_verify_email_async(e) for e in emails))
+    return {"results": list(results)}
+
+
+async def hunter_find_email_async(
+    domain: str,
+    first_name: str,
+    last_name: str,
+) -> Dict[str, Any]:
+    """Find and verify a specific person's email via Hunter.io.
+
+    Args:
+        domain: Company domain.
+        first_name: Contact's first name.
+        last_name: Contact's last name.
+
+    Returns:
+        Dict with 'email', 'score', 'verified'.
+    """
+    key = _find_key(domain, first_name, last_name)
+    cached = _FIND_CACHE.get(key) or _FIND_MISS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        data = await _get_data(
+            "/email-finder", {"domain": domain, "first_name": first_name, "last_name": last_name},
+        )
+        result = _find_result(data)
+        _FIND_CACHE.set(key, result)
+        return result
     except Exception as exc:
-        return {"email": "", "verified": False, "error": str(exc)}
+        return _find_miss(key, exc)
+
+
+async def hunter_find_and_verify_async(
+    domain: str,
+    first_name: str,
+    last_name: str,
+    verify_threshold: int = VERIFY_THRESHOLD,
+) -> Dict[str, Any]:
+    """Find a person's email via Hunter.io, verifying it only when the score is borderline.
+
+    Prefer this over hunter_find_email followed by hunter_verify_email:
+    high-confidence finds skip the verifier (and its credit) entirely.
+
+    Args:
+        domain: Company domain.
+        first_name: Contact's first name.
+        last_name: Contact's last name.
+        verify_threshold: Finder score at or above which the email is
+            trusted without a verifier call (default 90).
+
+    Returns:
+        Dict with 'email', 'score', 'verified', and 'verified_by'
+        ('score', 'verifier', or None).
+    """
+    found = await hunter_find_email_async(domain, first_name, last_name)
+    trusted = _trusted_find(found, verify_threshold)
+    if trusted is not None:
+        return trusted
+    return _verified_find(found, await hunter_verify_email_async(found["email"]))
 
 
 # ---------------------------------------------------------------------------
@@ -138,6 +465,31 @@ def hunter_find_email(
 # ---------------------------------------------------------------------------
 
 
+RECIPIENTS_PER_CALL = 50  # Hunter's per-request cap on campaign recipients
+
+
+def _lead_payload(
+    email: str,
+    first_name: str,
+    last_name: str,
+    position: str,
+    company: str,
+    website: str,
+    leads_list_id: Optional[int],
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "email": email,
+        "first_name": first_name,
+        "last_name": last_name,
+        "position": position,
+        "company": company,
+        "website": website,
+    }
+    if leads_list_id is not None:
+        payload["leads_list_id"] = leads_list_id
+    return payload
+
+
 def hunter_create_lead(
     email: str,
     first_name: str = "",
@@ -162,29 +514,66 @@ def hunter_create_lead(
         Dict with 'lead_id' and 'email'.
     """
     try:
-        payload: Dict[str, Any] = {
-            "email": email,
-            "first_name": first_name,
-            "last_name": last_name,
-            "position": position,
-            "company": company,
-            "website": website,
-        }
-        if leads_list_id is not None:
-            payload["leads_list_id"] = leads_list_id
-        resp = requests.post(
+        payload = _lead_payload(email, first_name, last_name, position, company, website, leads_list_id)
+        resp = _BREAKER.call(
+            _SESSION.post,
             f"{HUNTER_BASE}/leads",
             params={"api_key": _api_key()},
             json=payload,
             timeout=10,
         )
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
+        data = response_json(resp).get("data", {})
         return {"lead_id": data.get("id"), "email": email}
     except Exception as exc:
         return {"lead_id": None, "email": email, "error": str(exc)}
 
 
+async def hunter_create_lead_async(
+    email: str,
+    first_name: str = "",
+    last_name: str = "",
+    position: str = "",
+    company: str = "",
+    website: str = "",
+    leads_list_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Create a lead in Hunter. Free API call — no credits consumed.
+
+    Args:
+        email: Lead email address (required).
+        first_name: Contact first name.
+        last_name: Contact last name.
+        position: Job title.
+        company: Company name.
+        website: Company domain.
+        leads_list_id: Optional list to add the lead to.
+
+    Returns:
+        Dict with 'lead_id' and 'email'.
+    """
+    try:
+        payload = _lead_payload(email, first_name, last_name, position, company, website, leads_list_id)
+        data = await _post_data("/leads", payload)
+        return {"lead_id": data.get("id"), "email": email}
+    except Exception as exc:
+        return {"lead_id": None, "email": email, "error": str(exc)}
+
+
+async def hunter_create_leads_batch(leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create several Hunter leads at once. Free API calls.
+
+    Args:
+        leads: One dict of hunter_create_lead arguments per lead ('email'
+            required).
+
+    Returns:
+        Dict with 'results' — one hunter_create_lead result per lead, in
+        input order.
+    """
+    results = await asyncio.gather(*(hunter_create_lead_async(**lead) for lead in leads))
+    return {"results": list(results)}
+
+
 def hunter_add_recipient(
     campaign_id: int,
     emails: List[str],
@@ -195,40 +584,47 @@ def hunter_add_recipient(
     WARNING: If the sequence is already started, emails may send shortly
     after this call — there is no undo window.
 
+    Hunter accepts at most 50 recipients per request, so longer lists are
+    sent in chunks of 50 and the results summed.
+
     Args:
         campaign_id: Hunter campaign/sequence ID.
-        emails: List of email addresses (max 50 per call).
-        lead_ids: Optional list of Hunter lead IDs (max 50 per call).
+        emails: List of email addresses.
+        lead_ids: Optional list of Hunter lead IDs, parallel to emails.
             At least one of emails or lead_ids must be provided.
 
     Returns:
         Dict with 'campaign_id', 'recipients_added' (int), and 'skipped_recipients' (list).
+        On error, includes 'error' key (chunks sent before the error are counted).
     """
+    added = 0
+    skipped: List[Any] = []
+    lead_ids = lead_ids or []
     try:
-        if len(emails) > 50:
-            logger.warning(
-                "Hunter API limit is 50 recipients per call; truncating from %d to 50. "
-                "Remaining recipients will NOT be added.",
-                len(emails),
+        for start in range(0, max(len(emails), len(lead_ids)), RECIPIENTS_PER_CALL):
+            payload: Dict[str, Any] = {"emails": emails[start:start + RECIPIENTS_PER_CALL]}
+            if lead_ids:
+                payload["lead_ids"] = lead_ids[start:start + RECIPIENTS_PER_CALL]
+            resp = _BREAKER.call(
+                _SESSION.post,
+                f"{HUNTER_BASE}/campaigns/{campaign_id}/recipients",
+                params={"api_key": _api_key()},
+                json=payload,
+                timeout=10,
             )
-        payload: Dict[str, Any] = {"emails": emails[:50]}
-        if lead_ids:
-            payload["lead_ids"] = lead_ids[:50]
-        resp = requests.post(
-            f"{HUNTER_BASE}/campaigns/{campaign_id}/recipients",
-            params={"api_key": _api_key()},
-            json=payload,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-        return {
-            "campaign_id": campaign_id,
-            "recipients_added": data.get("recipients_added", 0),
-            "skipped_recipients": data.get("skipped_recipients", []),
-        }
+            data = response_json(resp).get("data", {})
+            added += data.get("recipients_added", 0)
+            skipped.extend(data.get("skipped_recipients", []))
     except Exception as exc:
-        return {"campaign_id": campaign_id, "recipients_added": 0, "skipped_recipients": [], "error": str(exc)}
+        return {"campaign_id": campaign_id, "recipients_added": added, "skipped_recipients": skipped, "error": str(exc)}
+    finally:
+        hunter_invalidate_campaigns()
+    return {"campaign_id": campaign_id, "recipients_added": added, "skipped_recipients": skipped}
+
+
+def hunter_invalidate_campaigns() -> None:
+    """Drop cached hunter_list_campaigns results after a campaign changes."""
+    _CAMPAIGNS_CACHE.clear()
 
 
 def hunter_list_campaigns(
@@ -244,14 +640,19 @@ def hunter_list_campaigns(
     Returns:
         Dict with 'campaigns' list.
     """
+    key = (started, min(limit, 100))
+    cached = _CAMPAIGNS_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         params: Dict[str, Any] = {"api_key": _api_key(), "limit": min(limit, 100)}
         if started is not None:
             params["started"] = str(started).lower()
-        resp = requests.get(f"{HUNTER_BASE}/campaigns", params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-        return {"campaigns": data.get("campaigns", [])}
+        resp = _BREAKER.call(_SESSION.get, f"{HUNTER_BASE}/campaigns", params=params, timeout=10)
+        data = response_json(resp).get("data", {})
+        result = {"campaigns": data.get("campaigns", [])}
+        _CAMPAIGNS_CACHE.set(key, result)
+        return result
     except Exception as exc:
         return {"campaigns": [], "error": str(exc)}
 
@@ -269,14 +670,15 @@ def hunter_start_campaign(campaign_id: int) -> Dict[str, Any]:
         Dict with 'campaign_id' and 'started' status.
     """
     try:
-        resp = requests.post(
+        resp = _BREAKER.call(
+            _SESSION.post,
             f"{HUNTER_BASE}/campaigns/{campaign_id}/start",
             params={"api_key": _api_key()},
             json={},
             timeout=10,
         )
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
+        hunter_invalidate_campaigns()
+        data = response_json(resp).get("data", {})
         return {
             "campaign_id": campaign_id,
             "started": True,
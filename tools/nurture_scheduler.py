@@ -0,0 +1,131 @@
+"""Deterministic re-contact date for NURTURE replies.
+
+Pulls the first timing cue out of a reply ("try me in Q3", "after our May
+conference", "reach out in 6 weeks") and applies the NurtureAgent rule —
+re-contact 1 week after the implied date, or 30 days out when there is no
+cue — without an LLM call. Uses stdlib regexes rather than a general-purpose
+date parser: replies only ever carry coarse cues, and a full parser reads
+"we may be interested" as the month of May.
+"""
+import calendar
+import re
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+DEFAULT_DELAY = timedelta(days=30)
+AFTER_EVENT_PAD = timedelta(weeks=1)
+
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({abbr.lower(): i for i, abbr in enumerate(calendar.month_abbr) if abbr})
+_MONTHS["sept"] = 9
+# Lower-case "may" is almost always the verb; only "May" counts as the month.
+_MONTH_NAMES = sorted((m for m in _MONTHS if m != "may"), key=len, reverse=True)
+
+# Season → (first month, last month), northern hemisphere.
+_SEASONS = {
+    "spring": (3, 5), "summer": (6, 8), "fall": (9, 11), "autumn": (9, 11), "winter": (12, 2),
+}
+
+_NUMBERS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "six": 6, "couple of": 2, "few": 3}
+
+_QUARTER = re.compile(r"\bq([1-4])(?:\s*'?(\d{2}|\d{4}))?\b", re.IGNORECASE)
+_MONTH = re.compile(
+    r"(?:\b(?i:" + "|".join(_MONTH_NAMES) + r")\b|\bMay\b)\.?(?:\s+(\d{4}))?"
+)
+_SEASON = re.compile(r"\b(" + "|".join(_SEASONS) + r")\b", re.IGNORECASE)
+_RELATIVE = re.compile(
+    r"\bin\s+(?:a\s+)?(\d+|" + "|".join(_NUMBERS) + r")\s+(day|week|month)s?\b", re.IGNORECASE
+)
+_NEXT = re.compile(r"\bnext\s+(month|quarter|year)\b", re.IGNORECASE)
+
+# "after our May conference", "until Q3", "end of summer" → use the END of the period.
+_AFTER = re.compile(
+    r"\b(?:after|until|till|post|past|end of|following|once)\b(?:\s+\S+){0,2}\s*$", re.IGNORECASE
+)
+
+
+def _month_end(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _period(start_month: int, end_month: int, year: Optional[int], after: bool, today: date) -> date:
+    """Implied date for a month range: its start, or its end for "after …"."""
+    def bounds(y: int) -> Tuple[date, date]:
+        end_year = y + 1 if end_month < start_month else y
+        return date(y, start_month, 1), _month_end(end_year, end_month)
+
+    y = year or today.year
+    start, end = bounds(y)
+    if year is None and end < today:
+        start, end = bounds(y + 1)
+    return end if after else max(start, today)
+
+
+def _add_months(d: date, months: int) -> date:
+    y, m = divmod(d.month - 1 + months, 12)
+    return date(d.year + y, m + 1, min(d.day, calendar.monthrange(d.year + y, m + 1)[1]))
+
+
+def _year(raw: Optional[str]) -> Optional[int]:
+    if not raw:
+        return None
+    return int(raw) if len(raw) == 4 else 2000 + int(raw)
+
+
+def _cues(text: str, today: date) -> List[Tuple[int, date]]:
+    """All timing cues as (position, re-contact date), in no particular order."""
+    def after(m: re.Match) -> bool:
+        return bool(_AFTER.search(text, 0, m.start()))
+
+    cues = []
+    for m in _QUARTER.finditer(text):
+        q = int(m.group(1))
+        implied = _period(3 * q - 2, 3 * q, _year(m.group(2)), after(m), today)
+        cues.append((m.start(), implied + AFTER_EVENT_PAD))
+    for m in _MONTH.finditer(text):
+        month = _MONTHS[m.group(0).split()[0].rstrip(".").lower()]
+        implied = _period(month, month, _year(m.group(1)), after(m), today)
+        cues.append((m.start(), implied + AFTER_EVENT_PAD))
+    for m in _SEASON.finditer(text):
+        implied = _period(*_SEASONS[m.group(1).lower()], None, after(m), today)
+        cues.append((m.start(), implied + AFTER_EVENT_PAD))
+    # Relative offsets already say when to come back — no extra week.
+    for m in _RELATIVE.finditer(text):
+        raw, unit = m.group(1).lower(), m.group(2).lower()
+        n = int(raw) if raw.isdigit() else _NUMBERS[raw]
+        if unit == "month":
+            cues.append((m.start(), _add_months(today, n)))
+        else:
+            cues.append((m.start(), today + timedelta(days=n * (7 if unit == "week" else 1))))
+    for m in _NEXT.finditer(text):
+        unit = m.group(1).lower()
+        if unit == "month":
+            cues.append((m.start(), _add_months(today.replace(day=1), 1)))
+        elif unit == "quarter":
+            first = 3 * ((today.month - 1) // 3) + 1
+            cues.append((m.start(), _add_months(date(today.year, first, 1), 3)))
+        else:
+            cues.append((m.start(), date(today.year + 1, 1, 1)))
+    return cues
+
+
+def find_timing_cue(reply_text: str, today: Optional[date] = None) -> Optional[date]:
+    """Re-contact date implied by the first timing cue in a reply, if any."""
+    cues = _cues(reply_text, today or date.today())
+    return min(cues)[1] if cues else None
+
+
+def compute_recontact_date(reply_text: str, today: Optional[date] = None) -> date:
+    """Date to re-contact a NURTURE lead.
+
+    Args:
+        reply_text: Raw inbound reply body.
+        today: Reference date (default: date.today()).
+
+    Returns:
+        1 week after the period the reply points at ("Q3", "after our May
+        conference"), the exact offset for relative cues ("in 6 weeks"), or
+        30 days from today when the reply has no timing cue.
+    """
+    today = today or date.today()
+    return find_timing_cue(reply_text, today) or today + DEFAULT_DELAY
@@ -0,0 +1,145 @@
+"""Perplexity Search tool for Google ADK agents.
+
+One multi-query call replaces several sequential single-query searches, so the
+agent spends one tool turn (and one HTTP round-trip) instead of one per query.
+Falls back to Exa when PERPLEXITY_API_KEY is not set.
+``pplx_search_multi_async`` is for agents that run inside the per-lead fan-out,
+where a blocking call would stall every other lead's research.
+See https://docs.perplexity.ai/guides/search-quickstart
+"""
+import asyncio
+import functools
+import logging
+import os
+from typing import Any, Dict, List
+
+import httpx
+import requests
+
+from tools._json import response_json
+from tools.exa_tools import exa_search_companies, exa_search_companies_async
+
+logger = logging.getLogger(__name__)
+
+PPLX_BASE = "https://api.perplexity.ai"
+
+# Pooled session: research runs for many leads hit the same host back to back.
+_SESSION = requests.Session()
+
+
+def _exa_fallback(queries: List[str], max_results: int) -> Dict[str, Any]:
+    results = []
+    for q in queries:
+        r = exa_search_companies(q, num_results=max_results)
+        results.append({"query": q, "results": r.get("results", [])})
+    return {"results": results, "source": "exa"}
+
+
+def _parse(queries: List[str], data: Dict[str, Any]) -> Dict[str, Any]:
+    per_query = data.get("results", [])
+    # A single query comes back as a flat list rather than a list of lists.
+    if len(queries) == 1 and per_query and isinstance(per_query[0], dict):
+        per_query = [per_query]
+    results = [
+        {
+            "query": q,
+            "results": [
+                {
+                    "url": r.get("url", ""),
+                    "title": r.get("title") or "",
+                    "highlights": [r["snippet"]] if r.get("snippet") else [],
+                }
+                for r in hits
+            ],
+        }
+        for q, hits in zip(queries, per_query)
+    ]
+    return {"results": results, "source": "perplexity"}
+
+
+def _failed(queries: List[str], exc: Exception) -> Dict[str, Any]:
+    logger.warning("Perplexity search failed: %s", exc)
+    return {
+        "results": [{"query": q, "results": []} for q in queries],
+        "source": "perplexity",
+        "error": str(exc),
+    }
+
+
+def pplx_search_multi(queries: List[str], max_results: int = 5) -> Dict[str, Any]:
+    """Run several web searches in a single call.
+
+    Args:
+        queries: Natural language search queries (up to 5).
+        max_results: Results to return per query (default 5).
+
+    Returns:
+        Dict with 'results' list — one {query, results} entry per query, each
+        result containing url, title, highlights — and 'source'.
+        On error, includes 'error' key.
+    """
+    api_key = os.environ.get("PERPLEXITY_API_KEY")
+    if not api_key:
+        return _exa_fallback(queries, max_results)
+    try:
+        resp = _SESSION.post(
+            f"{PPLX_BASE}/search",
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={"query": queries, "max_results": max_results},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return _parse(queries, response_json(resp))
+    except Exception as exc:
+        return _failed(queries, exc)
+
+
+# ---------------------------------------------------------------------------
+# Async variant — for the per-lead research fan-out
+# ---------------------------------------------------------------------------
+_ASYNC_SEMAPHORE = asyncio.Semaphore(20)
+
+
+@functools.cache
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=PPLX_BASE,
+        timeout=30,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+
+
+async def _exa_fallback_async(queries: List[str], max_results: int) -> Dict[str, Any]:
+    found = await asyncio.gather(
+        *(exa_search_companies_async(q, num_results=max_results) for q in queries)
+    )
+    results = [{"query": q, "results": r.get("results", [])} for q, r in zip(queries, found)]
+    return {"results": results, "source": "exa"}
+
+
+async def pplx_search_multi_async(queries: List[str], max_results: int = 5) -> Dict[str, Any]:
+    """Run several web searches in a single call.
+
+    Args:
+        queries: Natural language search queries (up to 5).
+        max_results: Results to return per query (default 5).
+
+    Returns:
+        Dict with 'results' list — one {query, results} entry per query, each
+        result containing url, title, highlights — and 'source'.
+        On error, includes 'error' key.
+    """
+    api_key = os.environ.get("PERPLEXITY_API_KEY")
+    if not api_key:
+        return await _exa_fallback_async(queries, max_results)
+    try:
+        async with _ASYNC_SEMAPHORE:
+            resp = await _async_client().post(
+                "/search",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={"query": queries, "max_results": max_results},
+            )
+        resp.raise_for_status()
+        return _parse(queries, response_json(resp))
+    except Exception as exc:
+        return _failed(queries, exc)
@@ -0,0 +1,122 @@
+"""Deterministic fast path for inbound reply classification.
+
+Matches the trigger phrases listed in the ResponseClassifierAgent prompt with
+one precompiled regex per category, so obvious replies ("unsubscribe",
+"sounds good", "try me in Q3") are classified without an LLM call. Anything
+ambiguous returns None and should be sent to the LLM classifier.
+
+Only the reply's own text is matched: quoted lines, the "On … wrote:" tail
+and our unsubscribe footer are stripped first, so a quoted copy of the
+outbound email can't trigger a classification.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from schemas.campaign import EmailSequence
+
+# Keep in sync with the trigger phrases in teams/response_handling.py.
+TRIGGER_PHRASES: Dict[str, List[str]] = {
+    "INTERESTED": [
+        "sure", "sounds good", "happy to chat", "let's connect", "tell me more",
+        "let's find a time", "open to it", "yes", "that works",
+    ],
+    "NURTURE": [
+        "try me in q3", "we're mid-campaign", "check back after", "not right now",
+        "maybe later", "after our event", "reach out in",
+    ],
+    "NOT_FIT": [
+        "not interested", "we don't do events", "wrong person", "remove me",
+        "stop emailing", "we have this covered",
+    ],
+    "UNSUBSCRIBE": [
+        "unsubscribe", "take me off", "stop all emails", "do not contact",
+        "remove from list",
+    ],
+}
+
+
+def _compile(phrases: List[str]) -> re.Pattern:
+    # Longest first so "sounds good" wins over any shorter overlapping phrase.
+    alternation = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+_PATTERNS = {category: _compile(phrases) for category, phrases in TRIGGER_PHRASES.items()}
+
+# A hit preceded by one of these ("not sure", "no, that works for them",
+# "make sure") doesn't mean what the phrase says — defer to the LLM.
+_NEGATED = re.compile(r"(?:\bnot|\bno|\bnever|n't|\bmake)[\s,]+$", re.IGNORECASE)
+
+# Curly apostrophes from mail clients would otherwise miss "let's", "don't" etc.
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'"})
+
+# "sure" and "yes" open plenty of non-interested sentences ("Yes, we already
+# have an agency"), so on their own they only count as a standalone answer.
+_BARE_AFFIRMATIVES = {"sure", "yes"}
+_STANDALONE_AFFIRMATIVE = re.compile(
+    r"^\W*(?:sure|yes)(?:\W+(?:sure|yes|thing|please|thanks|thank you|absolutely|definitely))*\W*$",
+    re.IGNORECASE,
+)
+
+# Start of the quoted thread: Gmail/Apple "On <date>, <name> wrote:" (the
+# header may wrap onto a second line) or Outlook's "Original Message" rule.
+_QUOTE_HEADER = re.compile(
+    r"^(?:On\b[^\n]*(?:\n[^\n]*)?\bwrote:|-+\s*Original Message\s*-+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_FOOTER = re.compile(
+    re.escape(EmailSequence.model_fields["unsubscribe_footer"].default), re.IGNORECASE,
+)
+
+
+def _own_text(reply_text: str) -> str:
+    """Return the part of a reply its sender wrote, minus quotes and footer."""
+    text = reply_text.translate(_APOSTROPHES)
+    header = _QUOTE_HEADER.search(text)
+    if header:
+        text = text[:header.start()]
+    text = "\n".join(line for line in text.splitlines() if not line.lstrip().startswith(">"))
+    return _FOOTER.sub("", text).strip()
+
+
+def classify_fast(reply_text: str) -> Optional[Dict[str, Any]]:
+    """Classify a reply from trigger phrases alone, if it is unambiguous.
+
+    Any UNSUBSCRIBE phrase wins outright (opt-outs must always be honored).
+    Otherwise the reply is classified only when exactly one category matches
+    and none of its matches is negated. A bare "sure"/"yes" counts only when
+    it is the whole answer.
+
+    Args:
+        reply_text: Raw inbound reply body, possibly with the quoted thread.
+
+    Returns:
+        Dict with 'classification', 'key_phrase' and 'reasoning', or None if
+        the reply should go to the LLM classifier.
+    """
+    text = _own_text(reply_text)
+    standalone = bool(_STANDALONE_AFFIRMATIVE.match(text))
+    hits: Dict[str, List[re.Match]] = {}
+    for category, pattern in _PATTERNS.items():
+        matches = [
+            m for m in pattern.finditer(text)
+            if standalone or m.group(0).lower() not in _BARE_AFFIRMATIVES
+        ]
+        if matches:
+            hits[category] = matches
+
+    if "UNSUBSCRIBE" in hits:
+        category = "UNSUBSCRIBE"
+    elif len(hits) == 1:
+        category = next(iter(hits))
+        if any(_NEGATED.search(text, 0, m.start()) for m in hits[category]):
+            return None
+    else:
+        return None
+
+    key_phrase = hits[category][0].group(0)
+    return {
+        "classification": category,
+        "reasoning": f"Fast-path match on trigger phrase '{key_phrase}'.",
+        "key_phrase": key_phrase,
+    }
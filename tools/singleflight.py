@@ -0,0 +1,33 @@
+"""In-process request coalescing for async tool calls.
+
+When several agents ask for the same thing at the same time (e.g. parallel
+research runs issuing the same search), only the first call does the I/O;
+the rest await its result. Complements tools/_disk_cache.py, which handles
+repeats across runs — this handles duplicates that are in flight together.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class Singleflight:
+    """Shares one in-flight call per key among all concurrent callers.
+
+    The first caller for a key starts ``fn()`` as a task; callers arriving
+    while it runs await the same task. The key is forgotten as soon as the
+    task finishes, so later calls start fresh (results are not cached here).
+    Each caller awaits through ``asyncio.shield``, so one caller being
+    cancelled doesn't cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
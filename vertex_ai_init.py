@@ -8,7 +8,6 @@ Import this module before instantiating any LlmAgent.
 """
 import logging
 import os
-import vertexai
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +19,9 @@ def init_vertex_ai() -> None:
     else:
         project = os.environ["GOOGLE_CLOUD_PROJECT"]
         location = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-east5")
+        # Imported here: vertexai pulls in aiplatform/gRPC, which the
+        # Anthropic path never needs.
+        import vertexai
         vertexai.init(project=project, location=location)
         logger.info("LLM provider: Vertex AI (project=%s, location=%s)", project, location)
 